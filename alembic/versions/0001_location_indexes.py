@@ -0,0 +1,35 @@
+"""Add the nearby-search and geography indexes on locations
+
+Databases created by an older create_all already have the locations table but
+not the indexes declared on the model since, so every statement is idempotent.
+
+Revision ID: 0001_location_indexes
+Revises:
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_location_indexes"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_locations_point "
+        "ON locations USING gist (point(location_longitude, location_latitude))"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_locations_region_la "
+        "ON locations (location_region, location_local_authority)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_locations_region_la")
+    op.execute("DROP INDEX IF EXISTS ix_locations_point")
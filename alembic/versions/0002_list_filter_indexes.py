@@ -0,0 +1,35 @@
+"""Add the list-endpoint filter indexes on location_period_data and providers
+
+Idempotent for databases whose create_all already built them.
+
+Revision ID: 0002_list_filter_indexes
+Revises: 0001_location_indexes
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_list_filter_indexes"
+down_revision: Union[str, None] = "0001_location_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_lpd_period_care "
+        "ON location_period_data (period_id, is_care_home) "
+        "INCLUDE (location_id, latest_overall_rating)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_providers_region_sector "
+        "ON providers (provider_region, provider_type_sector)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_providers_region_sector")
+    op.execute("DROP INDEX IF EXISTS ix_lpd_period_care")
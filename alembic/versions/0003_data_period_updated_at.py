@@ -0,0 +1,28 @@
+"""Add data_periods.updated_at, bumped by every finished import
+
+Existing rows are backfilled from created_at. Idempotent for databases whose
+create_all already added the column.
+
+Revision ID: 0003_data_period_updated_at
+Revises: 0002_list_filter_indexes
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_data_period_updated_at"
+down_revision: Union[str, None] = "0002_list_filter_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE data_periods ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITHOUT TIME ZONE")
+    op.execute("UPDATE data_periods SET updated_at = created_at WHERE updated_at IS NULL")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE data_periods DROP COLUMN IF EXISTS updated_at")
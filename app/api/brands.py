@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.core.database import get_db
@@ -7,6 +8,9 @@ from app.schemas.brand import Brand, BrandCreate
 
 router = APIRouter()
 
+# The list endpoint fetches plain rows (no ORM entities); Brand validates them by attribute
+_BRANDS = BrandModel.__table__
+
 
 @router.get("/", response_model=List[Brand])
 def get_brands(
@@ -14,8 +18,7 @@ def get_brands(
     limit: int = Query(100, ge=1, le=1000),
     db: Session = Depends(get_db)
 ):
-    brands = db.query(BrandModel).offset(skip).limit(limit).all()
-    return brands
+    return db.execute(select(_BRANDS).offset(skip).limit(limit)).all()
 
 
 @router.get("/{brand_id}", response_model=Brand)
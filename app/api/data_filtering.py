@@ -6,9 +6,7 @@ from pydantic import BaseModel, Field
 import logging
 import json
 from app.core.database import get_db
-from app.models.regulated_activity import RegulatedActivity
-from app.models.service_type import ServiceType  
-from app.models.service_user_band import ServiceUserBand
+from app.utils.reference_cache import get_reference_names
 import re
 
 router = APIRouter()
@@ -146,28 +144,26 @@ def get_dynamic_available_columns(db: Session) -> Dict[str, str]:
             base_columns[f"dual_{col_name}"] = f"dr.{col_name}"
     
     # Dynamically add regulated activities - use original CSV column names
-    activities = db.query(RegulatedActivity).all()
-    for activity in activities:
+    reference_names = get_reference_names(db)
+    for activity_id, activity_name in reference_names["regulated_activities"]:
         # Use the original column name exactly as it appears in CSV
-        original_column_name = activity.activity_name
+        original_column_name = activity_name
         # Use EXISTS subquery to check if location has this activity for the current period
-        base_columns[original_column_name] = f"EXISTS (SELECT 1 FROM location_regulated_activities lra WHERE lra.location_id = l.location_id AND lra.activity_id = {activity.activity_id} AND lra.period_id = lpd.period_id)"
+        base_columns[original_column_name] = f"EXISTS (SELECT 1 FROM location_regulated_activities lra WHERE lra.location_id = l.location_id AND lra.activity_id = {activity_id} AND lra.period_id = lpd.period_id)"
     
     # Dynamically add service types - use original CSV column names
-    service_types = db.query(ServiceType).all()
-    for service_type in service_types:
+    for service_type_id, service_type_name in reference_names["service_types"]:
         # Use the original column name exactly as it appears in CSV
-        original_column_name = service_type.service_type_name
+        original_column_name = service_type_name
         # Use EXISTS subquery to check if location has this service type for the current period
-        base_columns[original_column_name] = f"EXISTS (SELECT 1 FROM location_service_types lst WHERE lst.location_id = l.location_id AND lst.service_type_id = {service_type.service_type_id} AND lst.period_id = lpd.period_id)"
+        base_columns[original_column_name] = f"EXISTS (SELECT 1 FROM location_service_types lst WHERE lst.location_id = l.location_id AND lst.service_type_id = {service_type_id} AND lst.period_id = lpd.period_id)"
     
     # Dynamically add service user bands - use original CSV column names
-    user_bands = db.query(ServiceUserBand).all()
-    for band in user_bands:
+    for band_id, band_name in reference_names["service_user_bands"]:
         # Use the original column name exactly as it appears in CSV
-        original_column_name = band.band_name
+        original_column_name = band_name
         # Use EXISTS subquery to check if location has this user band for the current period
-        base_columns[original_column_name] = f"EXISTS (SELECT 1 FROM location_service_user_bands lsub WHERE lsub.location_id = l.location_id AND lsub.band_id = {band.band_id} AND lsub.period_id = lpd.period_id)"
+        base_columns[original_column_name] = f"EXISTS (SELECT 1 FROM location_service_user_bands lsub WHERE lsub.location_id = l.location_id AND lsub.band_id = {band_id} AND lsub.period_id = lpd.period_id)"
     
     return base_columns
 
@@ -629,34 +625,32 @@ def get_available_boolean_filters(db: Session = Depends(get_db)) -> Dict[str, An
         }
         
         # Get all regulated activities - use API column names (underscore format)
-        activities = db.query(RegulatedActivity).all()
-        for activity in activities:
-            original_column_name = activity.activity_name
+        reference_names = get_reference_names(db)
+        for _, activity_name in reference_names["regulated_activities"]:
+            original_column_name = activity_name
             api_column_name = convert_to_api_key(original_column_name)
             result["regulated_activities"].append({
-                "full_name": activity.activity_name,
+                "full_name": activity_name,
                 "filter_column": api_column_name,
                 "example_usage": f'filters=[{{"column":"{api_column_name}","value":true,"operator":"equals"}}]'
             })
         
         # Get all service types - use API column names (underscore format)
-        service_types = db.query(ServiceType).all()
-        for service_type in service_types:
-            original_column_name = service_type.service_type_name
+        for _, service_type_name in reference_names["service_types"]:
+            original_column_name = service_type_name
             api_column_name = convert_to_api_key(original_column_name)
             result["service_types"].append({
-                "full_name": service_type.service_type_name,
+                "full_name": service_type_name,
                 "filter_column": api_column_name,
                 "example_usage": f'filters=[{{"column":"{api_column_name}","value":true,"operator":"equals"}}]'
             })
         
         # Get all service user bands - use API column names (underscore format)
-        user_bands = db.query(ServiceUserBand).all()
-        for band in user_bands:
-            original_column_name = band.band_name
+        for _, band_name in reference_names["service_user_bands"]:
+            original_column_name = band_name
             api_column_name = convert_to_api_key(original_column_name)
             result["service_user_bands"].append({
-                "full_name": band.band_name,
+                "full_name": band_name,
                 "filter_column": api_column_name,
                 "example_usage": f'filters=[{{"column":"{api_column_name}","value":true,"operator":"equals"}}]'
             })
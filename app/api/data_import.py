@@ -1,24 +1,240 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Request
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Dict, Any, List
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from pathlib import Path
+import asyncio
 import logging
-from app.core.database import get_db
+import orjson
+import os
+import re
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from app.core.config import settings
+from app.core.database import Base, engine, get_async_db, get_db, SessionLocal
+from app.models.brand import Brand
+from app.models.provider import Provider
+from app.models.location import Location
+from app.models.location_period_data import LocationPeriodData
+from app.models.regulated_activity import RegulatedActivity
+from app.models.service_type import ServiceType
+from app.models.service_user_band import ServiceUserBand
+from app.models.data_period import DataPeriod
 from app.utils.data_import import CQCDataImporter
-from app.utils.parquet_converter import ParquetConverter
+from app.utils.parquet_converter import ParquetConverter, convert_in_worker_process
 from app.utils.import_status import import_tracker
+from app.utils.http_cache import REVALIDATE_CACHE_CONTROL, async_data_version, make_etag, not_modified, cacheable_response
+from app.utils.reference_cache import invalidate_reference_cache
+from app.utils.ttl_cache import TTLCache
 
-router = APIRouter()
+# orjson for every route: C-speed encoding with native date/datetime support
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
+# mm_yyyy with month 01-12 and year 2000-2030, validated by FastAPI before the handler runs
+_FILENAME_PATTERN = r'^(0[1-9]|1[0-2])_(20[0-2][0-9]|2030)\.(ods|xlsx)$'
+_BASENAME_PATTERN = r'^(0[1-9]|1[0-2])_(20[0-2][0-9]|2030)$'
+_ODS_FILENAME_PATTERN = r'^(0[1-9]|1[0-2])_(20[0-2][0-9]|2030)\.ods$'
+_FILENAME_RE = re.compile(_FILENAME_PATTERN)
+# Looser mm_yyyy shape for list inputs; month/year ranges are checked separately for specific errors
+_MULTI_FILENAME_RE = re.compile(r'^(\d{2})_(\d{4})\.(ods|xlsx)$')
 
-def import_data_background(excel_path: str, db: Session, filter_care_homes: bool = None, year: int = None, month: int = None):
-    """Background task to import data with Parquet optimization"""
+_DATA_FOLDER = Path("Data")
+
+# Per-file importer counters summed into the multi-file import totals
+_MULTI_IMPORT_STAT_KEYS = (
+    "brands_created", "providers_created", "locations_created",
+    "location_period_data_created",
+    "activities_created", "service_types_created", "user_bands_created",
+    "periods_created",
+)
+
+_MONTH_NAMES = ("", "January", "February", "March", "April", "May", "June",
+                "July", "August", "September", "October", "November", "December")
+
+
+@dataclass(frozen=True)
+class FileInfo:
+    """An ODS/XLSX file in the Data folder; month and year are None when the name is not mm_yyyy"""
+    filename: str
+    month: Optional[int]
+    year: Optional[int]
+    size: int
+
+    @property
+    def valid(self) -> bool:
+        return self.month is not None
+
+
+# Last parsed Data folder listing (and /available-files payload), rebuilt only
+# when the folder mtime changes - e.g. after a conversion writes Parquet files
+_files_cache: Dict[str, Any] = {"mtime": None, "files": [], "payload": None}
+
+# Imports run on dedicated worker threads so a multi-minute job never pins a
+# request worker; "synchronous" requests just wait on the future with a timeout.
+# Background imports share the same workers, so at most max_concurrent_imports
+# imports compete for memory, disk and DB connections at any time.
+_import_executor = ThreadPoolExecutor(max_workers=settings.max_concurrent_imports, thread_name_prefix="cqc-import")
+SYNC_IMPORT_TIMEOUT_SECONDS = 600
+
+# Table counts only change on import/clear; status pollers share one result per window
+DATABASE_STATISTICS_TTL_SECONDS = 30
+_statistics_cache = TTLCache(DATABASE_STATISTICS_TTL_SECONDS)
+
+# Progress pollers hit /import-progress every second or two; serve repeats from
+# memory instead of re-reading the tracker's status file for each one
+IMPORT_STATUS_TTL_SECONDS = 0.5
+_import_status_cache = TTLCache(IMPORT_STATUS_TTL_SECONDS)
+
+# Cap on file names echoed in 404 details so error paths stay cheap
+ERROR_FILE_LISTING_LIMIT = 20
+
+# Periods (mm_yyyy) with an import queued or running; a second request for the
+# same period gets a 409 instead of converting and importing the same data twice
+_active_imports: Set[str] = set()
+_active_imports_lock = threading.Lock()
+# Jobs submitted to the import workers and not yet finished (guarded by the same lock)
+_import_load: Dict[str, int] = {"jobs": 0}
+
+# Message suffix for each filter_care_homes value, shared by every import response
+_FILTER_MSG: Dict[Optional[bool], str] = {True: " (care homes only)", False: " (non-care homes only)", None: ""}
+
+
+def _scan_data_folder(folder_mtime: Optional[int] = None) -> List[FileInfo]:
+    """
+    ODS/XLSX files in the Data folder: valid names newest first, then invalid ones.
+    
+    One os.scandir pass and one regex match per file, repeated only when the
+    folder mtime (adding, removing or renaming a file bumps it) has changed.
+    """
+    if folder_mtime is None:
+        folder_mtime = _DATA_FOLDER.stat().st_mtime_ns
+    if _files_cache["mtime"] == folder_mtime:
+        return _files_cache["files"]
+    
+    valid_files = []
+    invalid_files = []
+    with os.scandir(_DATA_FOLDER) as entries:
+        for entry in entries:
+            if not (entry.name.endswith(('.ods', '.xlsx')) and entry.is_file()):
+                continue
+            match = _FILENAME_RE.match(entry.name)
+            if match:
+                valid_files.append(FileInfo(entry.name, int(match.group(1)), int(match.group(2)), entry.stat().st_size))
+            else:
+                invalid_files.append(FileInfo(entry.name, None, None, entry.stat().st_size))
+    valid_files.sort(key=lambda info: (info.year, info.month), reverse=True)
+    
+    files = valid_files + invalid_files
+    _files_cache.update(mtime=folder_mtime, files=files, payload=None)
+    return files
+
+
+def _available_files_message(suffix: Optional[str] = None) -> str:
+    """Capped, comma-separated data file names for 404 details; only built when raising"""
+    if not _DATA_FOLDER.exists():
+        return "Data folder not found"
+    names = [info.filename for info in _scan_data_folder() if not suffix or info.filename.endswith(suffix)]
+    if not names:
+        return "none"
+    message = ", ".join(names[:ERROR_FILE_LISTING_LIMIT])
+    if len(names) > ERROR_FILE_LISTING_LIMIT:
+        message += f" (+{len(names) - ERROR_FILE_LISTING_LIMIT} more)"
+    return message
+
+
+def _claim_import(*keys: str) -> None:
+    """Mark imports for these periods as active (all or none), or raise 409 if any already is"""
+    with _active_imports_lock:
+        busy = sorted(_active_imports.intersection(keys))
+        if busy:
+            raise HTTPException(
+                status_code=409,
+                detail=f"An import for {', '.join(busy)} is already in progress; check /import-progress for progress"
+            )
+        _active_imports.update(keys)
+
+
+def _release_import(keys: Tuple[str, ...]) -> None:
+    """Allow new imports for these periods again"""
+    with _active_imports_lock:
+        _active_imports.difference_update(keys)
+
+
+def _finish_import(keys: Tuple[str, ...]) -> None:
+    """Free the worker slot, allow new imports for these periods and drop cached period/reference lookups"""
+    with _active_imports_lock:
+        _import_load["jobs"] -= 1
+        _active_imports.difference_update(keys)
+    invalidate_reference_cache()
+
+
+def _submit_import(keys: Tuple[str, ...], func: Callable[..., Any], *args) -> Future:
+    """Queue an import on the import workers; its period claims are released when it finishes"""
+    with _active_imports_lock:
+        _import_load["jobs"] += 1
+    future = _import_executor.submit(func, *args)
+    future.add_done_callback(lambda _: _finish_import(keys))
+    return future
+
+
+def _import_response(action: str, filter_care_homes: Optional[bool], status: str = "completed", **fields) -> Dict[str, Any]:
+    """Build an import response with a fixed layout: message, request/result fields, filter, status"""
+    return {
+        "message": f"{action}{_FILTER_MSG[filter_care_homes]}",
+        **fields,
+        "filter_care_homes": filter_care_homes,
+        "status": status,
+    }
+
+
+def _queued_or_running() -> str:
+    """Status for a just-submitted background import: 'queued' when every worker is busy"""
+    with _active_imports_lock:
+        return "running" if _import_load["jobs"] <= settings.max_concurrent_imports else "queued"
+
+
+async def _wait_for_import(future: Future) -> Any:
+    """
+    Await an import job without holding a threadpool worker.
+    
+    The job is shielded so a timeout only stops waiting; the import itself
+    keeps running (or stays queued) on the import worker.
+    """
+    return await asyncio.wait_for(
+        asyncio.shield(asyncio.wrap_future(future)),
+        timeout=SYNC_IMPORT_TIMEOUT_SECONDS
+    )
+
+
+def _ensure_parquet(source_path: Path, data_folder: Path) -> Dict[str, Any]:
+    """Convert a source file to Parquet unless up-to-date Parquet files already exist"""
+    converter = ParquetConverter()
+    existing = converter.find_up_to_date_parquet(str(source_path), str(data_folder))
+    if existing:
+        logger.info(f"♻️  Reusing cached Parquet files for {source_path.name} (not older than the source)")
+        return {**existing, "stats": {"reused_existing_parquet": True}}
+    
+    return convert_in_worker_process(str(source_path), str(data_folder))
+
+
+def import_data_background(excel_path: str, filter_care_homes: Optional[bool] = None, year: int = None, month: int = None):
+    """
+    Background task to import data with Parquet optimization.
+    
+    Runs after the response is sent, so it opens its own session instead of
+    borrowing the request-scoped one.
+    """
+    db = SessionLocal()
     try:
         # Convert to Parquet files for faster processing
         data_folder = Path(excel_path).parent
-        converter = ParquetConverter()
-        conversion_result = converter.convert_ods_to_parquet(excel_path, str(data_folder))
+        conversion_result = _ensure_parquet(Path(excel_path), data_folder)
         
         main_parquet = conversion_result["main_parquet"]
         dual_parquet = conversion_result["dual_parquet"]
@@ -29,95 +245,25 @@ def import_data_background(excel_path: str, db: Session, filter_care_homes: bool
         logger.info(f"Parquet import completed: {stats}")
     except Exception as e:
         logger.error(f"Background import failed: {str(e)}")
+    finally:
+        db.close()
 
 
-@router.post("/import-by-filename")
-def import_by_filename(
-    background_tasks: BackgroundTasks,
-    filename: str = Query(..., description="Filename in format mm_yyyy.ods or mm_yyyy.xlsx (e.g., '08_2025.ods', '06_2025.xlsx')"),
-    run_in_background: bool = Query(False, description="Run import in background"),
-    filter_care_homes: bool = Query(None, description="Filter: True=care homes only, False=non-care homes only, None=all"),
-    db: Session = Depends(get_db)
-) -> Dict[str, Any]:
-    """
-    Import CQC data by filename from Data folder with Parquet optimization.
-    
-    This endpoint automatically converts ODS/XLSX files to Parquet format for dramatically faster processing,
-    then uses an optimized dual registration lookup system for improved performance.
-    
-    Args:
-        filename: Filename in format mm_yyyy.ods or mm_yyyy.xlsx (e.g., "08_2025.ods", "06_2025.xlsx")
-        run_in_background: If True, run import as background task
-        filter_care_homes: If True, import only care homes; if False, import only non-care homes; if None, import all
-        
-    Returns:
-        Import statistics and status, including Parquet conversion metrics
-        
-    Performance: ~10-20x faster than direct ODS import (45 minutes → 2-5 minutes)
-        
-    Examples:
-        - filename="08_2025.ods" (converts to Parquet, then imports August 2025 data)
-        - filename="06_2025.xlsx" (converts to Parquet, then imports June 2025 data)
-        - filename="01_2024.ods" (converts to Parquet, then imports January 2024 data)
-    """
-    import re
-    import os
-    
-    # Parse month and year from filename (support both .ods and .xlsx)
-    pattern = r'^(\d{2})_(\d{4})\.(ods|xlsx)$'
-    match = re.match(pattern, filename)
-    
-    if not match:
-        raise HTTPException(
-            status_code=400, 
-            detail=f"Invalid filename format. Expected format: mm_yyyy.ods or mm_yyyy.xlsx (e.g., 08_2025.ods, 06_2025.xlsx). Got: {filename}"
-        )
-    
-    month = int(match.group(1))
-    year = int(match.group(2))
-    
-    # Validate month
-    if not (1 <= month <= 12):
-        raise HTTPException(status_code=400, detail=f"Month must be between 01 and 12. Got: {month:02d}")
-    
-    # Validate year
-    if year < 2000 or year > 2030:
-        raise HTTPException(status_code=400, detail=f"Year must be between 2000 and 2030. Got: {year}")
-    
-    # Construct full file path
-    data_folder = Path("Data")
-    file_path = data_folder / filename
-    
-    # Validate file exists
-    if not file_path.exists():
-        available_files = []
-        if data_folder.exists():
-            available_files = list(data_folder.glob('*.ods')) + list(data_folder.glob('*.xlsx'))
-        raise HTTPException(
-            status_code=404, 
-            detail=f"File not found: {file_path}. Available files: {available_files if available_files else 'Data folder not found'}"
-        )
-    
-    if run_in_background:
-        background_tasks.add_task(import_data_background, str(file_path), db, filter_care_homes, year, month)
-        filter_msg = ""
-        if filter_care_homes is True:
-            filter_msg = " (care homes only)"
-        elif filter_care_homes is False:
-            filter_msg = " (non-care homes only)"
-        
-        return {
-            "message": f"Optimized Parquet import started in background{filter_msg}",
-            "filename": filename,
-            "file_path": str(file_path),
-            "year": year,
-            "month": month,
-            "filter_care_homes": filter_care_homes,
-            "status": "running",
-            "optimization": "ODS will be converted to Parquet files for faster processing"
-        }
-    
-    # Run import synchronously with Parquet optimization
+def _track_import_progress(done: int, total: int, stats: Dict[str, Any]) -> None:
+    """Report per-batch import progress to the tracker, mapped onto the 50-95% import phase"""
+    fraction = done / total if total else 1
+    import_tracker.update_phase(
+        "data_import",
+        f"Imported {done}/{total} records ({stats.get('locations_created', 0)} new locations)",
+        50 + int(45 * fraction)
+    )
+
+
+def run_filename_import(file_path: Path, filter_care_homes: Optional[bool] = None, year: int = None, month: int = None) -> Dict[str, Any]:
+    """Convert a Data folder file to Parquet and import it with status tracking (runs on the import worker)"""
+    filename = file_path.name
+    data_folder = file_path.parent
+    db = SessionLocal()
     try:
         file_size_mb = file_path.stat().st_size / (1024*1024)
         logger.info(f"🚀 Starting optimized import process for {filename}")
@@ -130,10 +276,9 @@ def import_by_filename(
         # Convert ODS/XLSX to Parquet files for faster processing
         logger.info("🔄 Phase 1: Converting to Parquet files for optimized processing...")
         import_tracker.update_phase("parquet_conversion", "Converting ODS file to Parquet format", 10)
-        converter = ParquetConverter()
         
         try:
-            conversion_result = converter.convert_ods_to_parquet(str(file_path), str(data_folder))
+            conversion_result = _ensure_parquet(file_path, data_folder)
         except Exception as conversion_error:
             error_msg = f"Parquet conversion failed: {str(conversion_error)}"
             logger.error(error_msg)
@@ -147,7 +292,7 @@ def import_by_filename(
                     "message": "Import failed due to file processing timeout",
                     "error": "File is too large or complex for processing. Consider using a smaller file or contact support.",
                     "filename": filename,
-                    "file_size_mb": round(file_path.stat().st_size / (1024*1024), 1),
+                    "file_size_mb": round(file_size_mb, 1),
                     "status": "timeout_error",
                     "import_id": import_id,
                     "suggestions": [
@@ -173,7 +318,8 @@ def import_by_filename(
         logger.info("🚀 Phase 2: Starting optimized import from Parquet files...")
         import_tracker.update_phase("data_import", "Importing data from Parquet files", 50)
         importer = CQCDataImporter(db)
-        stats = importer.import_from_parquet(main_parquet, dual_parquet, filter_care_homes, year, month)
+        stats = importer.import_from_parquet(main_parquet, dual_parquet, filter_care_homes, year, month,
+                                             progress_callback=_track_import_progress)
         
         import_tracker.complete_phase("data_import")
         import_tracker.complete_import(stats)
@@ -181,43 +327,118 @@ def import_by_filename(
         logger.info("🎉 Import process completed successfully!")
         logger.info(f"📈 Performance summary: {stats.get('records_processed', 0)} records in {stats.get('import_time_seconds', 0):.1f}s")
         
-        filter_msg = ""
-        if filter_care_homes is True:
-            filter_msg = " (care homes only)"
-        elif filter_care_homes is False:
-            filter_msg = " (non-care homes only)"
-        
-        return {
-            "message": f"Optimized Parquet import completed{filter_msg}",
-            "filename": filename,
-            "file_path": str(file_path),
-            "year": year,
-            "month": month,
-            "filter_care_homes": filter_care_homes,
-            "status": "completed",
-            "import_id": import_id,
-            "parquet_files": {
+        return _import_response(
+            "Optimized Parquet import completed",
+            filter_care_homes,
+            filename=filename,
+            file_path=str(file_path),
+            year=year,
+            month=month,
+            import_id=import_id,
+            parquet_files={
                 "main_data": main_parquet,
                 "dual_registrations": dual_parquet
             },
-            "conversion_stats": conversion_result["stats"],
-            "import_statistics": stats
-        }
+            conversion_stats=conversion_result["stats"],
+            import_statistics=stats
+        )
         
+    except Exception as e:
+        import_tracker.fail_import(str(e))
+        raise
+    finally:
+        db.close()
+
+
+@router.post("/import-by-filename")
+async def import_by_filename(
+    filename: str = Query(..., pattern=_FILENAME_PATTERN, description="Filename in format mm_yyyy.ods or mm_yyyy.xlsx (e.g., '08_2025.ods', '06_2025.xlsx')"),
+    run_in_background: bool = Query(False, description="Run import in background"),
+    filter_care_homes: Optional[bool] = Query(None, description="Filter: True=care homes only, False=non-care homes only, None=all")
+) -> Dict[str, Any]:
+    """
+    Import CQC data by filename from Data folder with Parquet optimization.
+    
+    This endpoint automatically converts ODS/XLSX files to Parquet format for dramatically faster processing,
+    then uses an optimized dual registration lookup system for improved performance.
+    
+    Args:
+        filename: Filename in format mm_yyyy.ods or mm_yyyy.xlsx (e.g., "08_2025.ods", "06_2025.xlsx")
+        run_in_background: If True, run import as background task
+        filter_care_homes: If True, import only care homes; if False, import only non-care homes; if None, import all
+        
+    Returns:
+        Import statistics and status, including Parquet conversion metrics
+        
+    Performance: ~10-20x faster than direct ODS import (45 minutes → 2-5 minutes)
+        
+    Examples:
+        - filename="08_2025.ods" (converts to Parquet, then imports August 2025 data)
+        - filename="06_2025.xlsx" (converts to Parquet, then imports June 2025 data)
+        - filename="01_2024.ods" (converts to Parquet, then imports January 2024 data)
+    """
+    # Filename format, month and year range are already enforced by the Query pattern
+    month = int(filename[0:2])
+    year = int(filename[3:7])
+    
+    # Construct full file path
+    data_folder = _DATA_FOLDER
+    file_path = data_folder / filename
+    
+    # Validate file exists
+    if not file_path.exists():
+        raise HTTPException(
+            status_code=404, 
+            detail=f"File not found: {file_path}. Available files: {_available_files_message()}. See /available-files for the full list"
+        )
+    
+    import_key = f"{month:02d}_{year}"
+    _claim_import(import_key)
+    
+    if run_in_background:
+        _submit_import((import_key,), import_data_background, str(file_path), filter_care_homes, year, month)
+        return _import_response(
+            "Optimized Parquet import started in background",
+            filter_care_homes,
+            status=_queued_or_running(),
+            filename=filename,
+            file_path=str(file_path),
+            year=year,
+            month=month,
+            optimization="ODS will be converted to Parquet files for faster processing"
+        )
+    
+    # Run the import on the import worker; this request only waits on the result
+    future = _submit_import((import_key,), run_filename_import, file_path, filter_care_homes, year, month)
+    try:
+        return await _wait_for_import(future)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail=f"Import exceeded {SYNC_IMPORT_TIMEOUT_SECONDS // 60} minutes and is still running; check /import-progress for progress"
+        )
     except Exception as e:
         logger.error(f"Import failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
 
 
+def run_excel_import(file_path: str, filter_care_homes: Optional[bool] = None, year: int = None, month: int = None) -> Dict[str, Any]:
+    """Import an Excel/ODS file directly with its own session (runs on the import worker)"""
+    db = SessionLocal()
+    try:
+        importer = CQCDataImporter(db)
+        return importer.import_from_excel(file_path, filter_care_homes, year, month)
+    finally:
+        db.close()
+
+
 @router.post("/import-excel")
-def import_excel_data(
-    background_tasks: BackgroundTasks,
-    year: int,
-    month: int,
-    file_path: str,
-    run_in_background: bool = False,
-    filter_care_homes: bool = None,
-    db: Session = Depends(get_db)
+async def import_excel_data(
+    year: int = Query(..., ge=2000, le=2030, description="Year of the data (2000-2030)"),
+    month: int = Query(..., ge=1, le=12, description="Month of the data (1-12)"),
+    file_path: str = Query(..., min_length=1, description="Full path to the Excel (.xlsx) or ODS (.ods) file"),
+    run_in_background: bool = Query(False, description="Run import in background"),
+    filter_care_homes: Optional[bool] = Query(None, description="Filter: True=care homes only, False=non-care homes only, None=all")
 ) -> Dict[str, Any]:
     """
     [DEPRECATED] Import CQC data from Excel/ODS file to database.
@@ -237,13 +458,6 @@ def import_excel_data(
         - file_path="/home/user/data/01AugustLatest.xlsx"
         - file_path="/home/user/data/01 July 2025 HSCA Active Locations.ods"
     """
-    # Validate parameters
-    if not (1 <= month <= 12):
-        raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
-    
-    if year < 2000 or year > 2030:
-        raise HTTPException(status_code=400, detail="Year must be between 2000 and 2030")
-    
     # Validate file exists
     file_obj = Path(file_path)
     if not file_obj.exists():
@@ -259,78 +473,88 @@ def import_excel_data(
             detail="File must be an Excel (.xlsx, .xls) or OpenDocument (.ods) file"
         )
     
+    import_key = f"{month:02d}_{year}"
+    _claim_import(import_key)
+    
     if run_in_background:
-        background_tasks.add_task(import_data_background, file_path, db, filter_care_homes, year, month)
-        filter_msg = ""
-        if filter_care_homes is True:
-            filter_msg = " (care homes only)"
-        elif filter_care_homes is False:
-            filter_msg = " (non-care homes only)"
-        
-        return {
-            "message": f"Data import started in background{filter_msg}",
-            "file_path": file_path,
-            "year": year,
-            "month": month,
-            "filter_care_homes": filter_care_homes,
-            "status": "running"
-        }
+        _submit_import((import_key,), import_data_background, file_path, filter_care_homes, year, month)
+        return _import_response(
+            "Data import started in background",
+            filter_care_homes,
+            status=_queued_or_running(),
+            file_path=file_path,
+            year=year,
+            month=month
+        )
     
-    # Run import synchronously
+    # Run the import on the import worker; this request only waits on the result
+    future = _submit_import((import_key,), run_excel_import, file_path, filter_care_homes, year, month)
     try:
-        importer = CQCDataImporter(db)
-        stats = importer.import_from_excel(file_path, filter_care_homes, year, month)
-        
-        filter_msg = ""
-        if filter_care_homes is True:
-            filter_msg = " (care homes only)"
-        elif filter_care_homes is False:
-            filter_msg = " (non-care homes only)"
-        
-        return {
-            "message": f"Data import completed{filter_msg}",
-            "file_path": file_path,
-            "year": year,
-            "month": month,
-            "filter_care_homes": filter_care_homes,
-            "status": "completed",
-            "statistics": stats
-        }
+        stats = await _wait_for_import(future)
+        
+        return _import_response(
+            "Data import completed",
+            filter_care_homes,
+            file_path=file_path,
+            year=year,
+            month=month,
+            statistics=stats
+        )
         
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail=f"Import exceeded {SYNC_IMPORT_TIMEOUT_SECONDS // 60} minutes and is still running; check /import-progress for progress"
+        )
     except Exception as e:
         logger.error(f"Import failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
 
 
+def _count_database_rows() -> Dict[str, int]:
+    """Row counts for the main tables in one round trip, on a short-lived session"""
+    counted_models = {
+        "brands": Brand,
+        "providers": Provider,
+        "locations": Location,
+        "location_period_data": LocationPeriodData,
+        "data_periods": DataPeriod,
+        "regulated_activities": RegulatedActivity,
+        "service_types": ServiceType,
+        "service_user_bands": ServiceUserBand
+    }
+    # All counts as scalar subqueries of one SELECT: a single round trip
+    counts_stmt = select(*(
+        select(func.count()).select_from(model).scalar_subquery().label(name)
+        for name, model in counted_models.items()
+    ))
+    with SessionLocal() as db:
+        return dict(db.execute(counts_stmt).one()._mapping)
+
+
+@router.get("/database-statistics")
 @router.get("/import-status")
-def get_import_status(db: Session = Depends(get_db)) -> Dict[str, Any]:
-    """Get current database statistics"""
-    from app.models.brand import Brand
-    from app.models.provider import Provider
-    from app.models.location import Location
-    from app.models.location_period_data import LocationPeriodData
-    # LocationActivityFlags import removed - table no longer used
-    from app.models.regulated_activity import RegulatedActivity
-    from app.models.service_type import ServiceType
-    from app.models.service_user_band import ServiceUserBand
-    from app.models.data_period import DataPeriod
+def get_database_statistics(request: Request) -> Dict[str, Any]:
+    """
+    Get current database statistics.
     
+    Also served at /import-status, which has always returned these counts; import
+    progress is at /import-progress.
+    
+    Counts are cached in-process for DATABASE_STATISTICS_TTL_SECONDS, so polling
+    clients only borrow a pooled connection once per window.
+    """
     try:
-        stats = {
-            "brands": db.query(Brand).count(),
-            "providers": db.query(Provider).count(),
-            "locations": db.query(Location).count(),
-            "location_period_data": db.query(LocationPeriodData).count(),
-            "data_periods": db.query(DataPeriod).count(),
-            "regulated_activities": db.query(RegulatedActivity).count(),
-            "service_types": db.query(ServiceType).count(),
-            "service_user_bands": db.query(ServiceUserBand).count()
-        }
+        stats = _statistics_cache.get_or_set("counts", _count_database_rows)
+        etag = make_etag("database-statistics", *sorted(stats.items()))
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
         
-        return {
+        return cacheable_response({
             "status": "success",
             "database_statistics": stats
-        }
+        }, etag)
 
     except Exception as e:
         logger.error(f"Failed to get statistics: {str(e)}")
@@ -338,9 +562,9 @@ def get_import_status(db: Session = Depends(get_db)) -> Dict[str, Any]:
 
 
 @router.delete("/clear-data")
-def clear_all_data(
+async def clear_all_data(
     confirm: bool = False,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, str]:
     """
     Clear all data from database (USE WITH CAUTION!)
@@ -355,30 +579,26 @@ def clear_all_data(
         )
     
     try:
-        from app.models.location import Location
-        from app.models.provider import Provider
-        from app.models.brand import Brand
-        from app.models.regulated_activity import RegulatedActivity, LocationRegulatedActivity
-        from app.models.service_type import ServiceType, LocationServiceType
-        from app.models.service_user_band import ServiceUserBand, LocationServiceUserBand
-        
-        # Delete in order due to foreign key constraints
-        db.query(LocationServiceUserBand).delete()
-        db.query(LocationServiceType).delete()
-        db.query(LocationRegulatedActivity).delete()
-        db.query(Location).delete()
-        db.query(Provider).delete()
-        db.query(Brand).delete()
-        db.query(ServiceUserBand).delete()
-        db.query(ServiceType).delete()
-        db.query(RegulatedActivity).delete()
-        
-        db.commit()
+        tables = Base.metadata.sorted_tables
+        if db.get_bind().dialect.name == "postgresql":
+            # One TRUNCATE is metadata-only: no per-row WAL, triggers or dead tuples
+            table_names = ", ".join(table.name for table in tables)
+            await db.execute(text(f"TRUNCATE TABLE {table_names} RESTART IDENTITY CASCADE"))
+            # Reset planner statistics so the next import is not planned against the old row counts
+            await db.execute(text(f"ANALYZE {table_names}"))
+        else:
+            # Delete children before parents due to foreign key constraints
+            for table in reversed(tables):
+                await db.execute(table.delete())
+        
+        await db.commit()
+        _statistics_cache.clear()
+        invalidate_reference_cache()
         
         return {"message": "All data cleared successfully"}
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Failed to clear data: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to clear data: {str(e)}")
 
@@ -401,13 +621,17 @@ def recreate_tables(
         )
     
     try:
-        from app.core.database import engine, Base
-        
         # Drop all tables
         Base.metadata.drop_all(bind=engine)
         
         # Recreate all tables
         Base.metadata.create_all(bind=engine)
+        if engine.dialect.name == "postgresql":
+            # Fresh tables have no planner statistics until autovacuum gets to them
+            with engine.begin() as conn:
+                conn.execute(text(f"ANALYZE {', '.join(table.name for table in Base.metadata.sorted_tables)}"))
+        _statistics_cache.clear()
+        invalidate_reference_cache()
         
         return {"message": "Database tables recreated successfully"}
         
@@ -418,37 +642,46 @@ def recreate_tables(
 
 
 @router.get("/data-periods")
-def get_data_periods(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def get_data_periods(request: Request, db: AsyncSession = Depends(get_async_db)) -> Dict[str, Any]:
     """Get all data periods with location counts"""
     try:
-        from app.models.data_period import DataPeriod
-        from app.models.location import Location
         
-        periods = db.query(DataPeriod).order_by(DataPeriod.year.desc(), DataPeriod.month.desc()).all()
+        etag = make_etag("data-periods", await async_data_version(db))
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+        
+        # One grouped query instead of a COUNT per period
+        result = await db.execute(
+            select(
+                DataPeriod.period_id,
+                DataPeriod.year,
+                DataPeriod.month,
+                DataPeriod.file_name,
+                DataPeriod.created_at,
+                func.count(LocationPeriodData.id).label("location_count")
+            )
+            .outerjoin(LocationPeriodData, LocationPeriodData.period_id == DataPeriod.period_id)
+            .group_by(DataPeriod.period_id)
+            .order_by(DataPeriod.year.desc(), DataPeriod.month.desc())
+        )
         
         period_list = []
-        for period in periods:
-            # Count locations in this period via LocationPeriodData
-            from app.models.location_period_data import LocationPeriodData
-            location_count = db.query(LocationPeriodData).filter(
-                LocationPeriodData.period_id == period.period_id
-            ).count()
-            
+        for period in result:
             period_list.append({
                 "period_id": period.period_id,
                 "year": period.year,
                 "month": period.month,
-                "month_name": ["", "January", "February", "March", "April", "May", "June",
-                              "July", "August", "September", "October", "November", "December"][period.month],
+                "month_name": _MONTH_NAMES[period.month],
                 "file_name": period.file_name,
-                "location_count": location_count,
-                "created_at": period.created_at.isoformat() if period.created_at else None
+                "location_count": period.location_count,
+                "created_at": period.created_at
             })
         
-        return {
+        return cacheable_response({
             "status": "success",
             "data_periods": period_list
-        }
+        }, etag)
         
     except Exception as e:
         logger.error(f"Failed to get data periods: {str(e)}")
@@ -457,17 +690,15 @@ def get_data_periods(db: Session = Depends(get_db)) -> Dict[str, Any]:
 
 
 @router.get("/available-files")
-def list_available_files() -> Dict[str, Any]:
+def list_available_files(request: Request) -> Dict[str, Any]:
     """
     List all available data files in the Data folder.
     
     Returns:
         List of available files with parsed month/year information
     """
-    import re
-    
     try:
-        data_folder = Path("Data")
+        data_folder = _DATA_FOLDER
         
         if not data_folder.exists():
             return {
@@ -476,50 +707,42 @@ def list_available_files() -> Dict[str, Any]:
                 "files": []
             }
         
-        files_info = []
-        pattern = r'^(\d{2})_(\d{4})\.(ods|xlsx)$'
+        # Adding, removing or renaming a file bumps the directory mtime
+        folder_mtime = data_folder.stat().st_mtime_ns
+        etag = make_etag("available-files", folder_mtime)
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
         
-        # Get all ODS and XLSX files in the Data folder
-        for file_path in list(data_folder.glob("*.ods")) + list(data_folder.glob("*.xlsx")):
-            filename = file_path.name
-            match = re.match(pattern, filename)
-            
-            if match:
-                month = int(match.group(1))
-                year = int(match.group(2))
-                month_names = ["", "January", "February", "March", "April", "May", "June",
-                              "July", "August", "September", "October", "November", "December"]
-                
-                files_info.append({
-                    "filename": filename,
-                    "month": month,
-                    "year": year,
-                    "month_name": month_names[month] if 1 <= month <= 12 else "Invalid",
-                    "display_name": f"{month_names[month] if 1 <= month <= 12 else 'Invalid'} {year}",
-                    "file_size": file_path.stat().st_size,
-                    "valid_format": True
-                })
-            else:
-                files_info.append({
-                    "filename": filename,
-                    "month": None,
-                    "year": None,
-                    "month_name": None,
-                    "display_name": f"{filename} (invalid format)",
-                    "file_size": file_path.stat().st_size,
-                    "valid_format": False
-                })
+        files = _scan_data_folder(folder_mtime)
+        cached_payload = _files_cache["payload"]
+        if cached_payload and cached_payload[0] == folder_mtime:
+            return cacheable_response(cached_payload[1], etag)
         
-        # Sort by year and month (most recent first)
-        files_info.sort(key=lambda x: (x.get('year') or 0, x.get('month') or 0), reverse=True)
+        files_info = []
+        for info in files:
+            # _FILENAME_RE only matches months 01-12, so the lookup is always valid
+            month_name = _MONTH_NAMES[info.month] if info.valid else None
+            files_info.append({
+                "filename": info.filename,
+                "month": info.month,
+                "year": info.year,
+                "month_name": month_name,
+                "display_name": f"{month_name} {info.year}" if info.valid else f"{info.filename} (invalid format)",
+                "file_size": info.size,
+                "valid_format": info.valid
+            })
         
-        return {
+        payload = {
             "status": "success",
             "data_folder": str(data_folder),
             "total_files": len(files_info),
-            "valid_files": len([f for f in files_info if f['valid_format']]),
+            "valid_files": sum(1 for info in files if info.valid),
             "files": files_info
         }
+        _files_cache["payload"] = (folder_mtime, payload)
+        
+        return cacheable_response(payload, etag)
         
     except Exception as e:
         logger.error(f"Failed to list available files: {str(e)}")
@@ -527,51 +750,58 @@ def list_available_files() -> Dict[str, Any]:
 
 
 @router.get("/location-history/{location_id}")
-def get_location_history(
-    location_id: int,
-    db: Session = Depends(get_db)
+async def get_location_history(
+    request: Request,
+    location_id: str,
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """Get historical data for a specific location across all periods"""
     try:
-        from app.models.data_period import DataPeriod
-        from app.models.location import Location
-        from app.models.location_period_data import LocationPeriodData
         
-        # First, get the static location info
-        location = db.query(Location).filter(Location.location_id == location_id).first()
-        if not location:
-            raise HTTPException(status_code=404, detail="Location not found")
+        etag = make_etag("location-history", location_id, await async_data_version(db))
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+        
+        # Plain column rows: no mapped entities, identity map or unit-of-work bookkeeping
+        stmt = (
+            select(
+                DataPeriod.year,
+                DataPeriod.month,
+                DataPeriod.file_name,
+                Location.location_name,
+                LocationPeriodData.latest_overall_rating,
+                LocationPeriodData.is_dormant,
+                LocationPeriodData.is_care_home,
+                LocationPeriodData.care_homes_beds,
+                Location.provider_id,
+                Location.location_region,
+                Location.location_local_authority,
+            )
+            .join_from(LocationPeriodData, DataPeriod, LocationPeriodData.period_id == DataPeriod.period_id)
+            .join(Location, LocationPeriodData.location_id == Location.location_id)
+            .where(LocationPeriodData.location_id == location_id)
+            .order_by(DataPeriod.year.desc(), DataPeriod.month.desc())
+        )
+        rows = (await db.execute(stmt)).mappings().all()
         
-        # Get all historical period data for this location
-        period_data = db.query(LocationPeriodData, DataPeriod).join(
-            DataPeriod, LocationPeriodData.period_id == DataPeriod.period_id
-        ).filter(
-            LocationPeriodData.location_id == location_id
-        ).order_by(DataPeriod.year.desc(), DataPeriod.month.desc()).all()
+        # Only pay for the existence check when there is no history to show
+        if not rows and (await db.execute(
+            select(Location.location_id).where(Location.location_id == location_id)
+        )).first() is None:
+            raise HTTPException(status_code=404, detail="Location not found")
         
         history_list = []
-        for lpd, period in period_data:
-            history_list.append({
-                "year": period.year,
-                "month": period.month,
-                "month_name": ["", "January", "February", "March", "April", "May", "June",
-                              "July", "August", "September", "October", "November", "December"][period.month],
-                "file_name": period.file_name,
-                "location_name": location.location_name,
-                "latest_overall_rating": lpd.latest_overall_rating,
-                "is_dormant": lpd.is_dormant,
-                "is_care_home": lpd.is_care_home,
-                "care_homes_beds": lpd.care_homes_beds,
-                "provider_id": location.provider_id,
-                "location_region": location.location_region,
-                "location_local_authority": location.location_local_authority
-            })
+        for row in rows:
+            entry = dict(row)
+            entry["month_name"] = _MONTH_NAMES[row["month"]]
+            history_list.append(entry)
         
-        return {
+        return cacheable_response({
             "status": "success",
             "location_id": location_id,
             "history": history_list
-        }
+        }, etag)
         
     except HTTPException:
         raise
@@ -582,7 +812,7 @@ def get_location_history(
 
 @router.post("/convert-ods-to-parquet")
 def convert_ods_to_parquet(
-    filename: str = Query(..., description="ODS filename in Data folder (e.g., '06_2025.ods')"),
+    filename: str = Query(..., pattern=_ODS_FILENAME_PATTERN, description="ODS filename in Data folder (e.g., '06_2025.ods')"),
     background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
@@ -596,31 +826,20 @@ def convert_ods_to_parquet(
         Conversion results and Parquet file paths
     """
     try:
-        # Validate filename format
-        import re
-        pattern = r'^(\d{2})_(\d{4})\.(ods)$'
-        match = re.match(pattern, filename)
-        
-        if not match:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid filename format. Expected format: mm_yyyy.ods (e.g., 06_2025.ods). Got: {filename}"
-            )
+        # Filename format is already enforced by the Query pattern
         
         # Check if ODS file exists
-        data_folder = Path("Data")
+        data_folder = _DATA_FOLDER
         ods_file_path = data_folder / filename
         
         if not ods_file_path.exists():
-            available_files = list(data_folder.glob("*.ods")) if data_folder.exists() else []
             raise HTTPException(
                 status_code=404,
-                detail=f"ODS file not found: {ods_file_path}. Available ODS files: {available_files}"
+                detail=f"ODS file not found: {ods_file_path}. Available ODS files: {_available_files_message(suffix='.ods')}. See /available-files for the full list"
             )
         
-        # Convert ODS to Parquet
-        converter = ParquetConverter()
-        result = converter.convert_ods_to_parquet(str(ods_file_path), str(data_folder))
+        # Convert ODS to Parquet in a worker process
+        result = convert_in_worker_process(str(ods_file_path), str(data_folder))
         
         return {
             "status": "success",
@@ -640,24 +859,31 @@ def convert_ods_to_parquet(
         raise HTTPException(status_code=500, detail=f"Conversion failed: {str(e)}")
 
 
-def import_parquet_background(main_parquet: str, dual_parquet: str, db: Session, filter_care_homes: bool = None, year: int = None, month: int = None):
-    """Background task to import data from Parquet files"""
+def run_parquet_import(main_parquet: str, dual_parquet: str, filter_care_homes: Optional[bool] = None, year: int = None, month: int = None) -> Dict[str, Any]:
+    """Import converted Parquet files with their own session (runs on the import worker)"""
+    db = SessionLocal()
     try:
         importer = CQCDataImporter(db)
-        stats = importer.import_from_parquet(main_parquet, dual_parquet, filter_care_homes, year, month)
+        return importer.import_from_parquet(main_parquet, dual_parquet, filter_care_homes, year, month)
+    finally:
+        db.close()
+
+
+def import_parquet_background(main_parquet: str, dual_parquet: str, filter_care_homes: Optional[bool] = None, year: int = None, month: int = None):
+    """Background task to import data from Parquet files on its own session"""
+    try:
+        stats = run_parquet_import(main_parquet, dual_parquet, filter_care_homes, year, month)
         logger.info(f"Parquet import completed: {stats}")
     except Exception as e:
         logger.error(f"Background Parquet import failed: {str(e)}")
 
 
 @router.post("/import-parquet-by-filename")
-def import_parquet_by_filename(
-    background_tasks: BackgroundTasks,
-    filename: str = Query(..., description="Base filename without extension (e.g., '06_2025' for '06_2025_main.parquet')"),
+async def import_parquet_by_filename(
+    filename: str = Query(..., pattern=_BASENAME_PATTERN, description="Base filename without extension (e.g., '06_2025' for '06_2025_main.parquet')"),
     run_in_background: bool = Query(False, description="Run import in background"),
-    filter_care_homes: bool = Query(None, description="Filter: True=care homes only, False=non-care homes only, None=all"),
-    auto_convert: bool = Query(True, description="Automatically convert ODS to Parquet if Parquet files don't exist"),
-    db: Session = Depends(get_db)
+    filter_care_homes: Optional[bool] = Query(None, description="Filter: True=care homes only, False=non-care homes only, None=all"),
+    auto_convert: bool = Query(True, description="Automatically convert ODS to Parquet if Parquet files don't exist")
 ) -> Dict[str, Any]:
     """
     Import CQC data from Parquet files for optimized performance.
@@ -675,113 +901,91 @@ def import_parquet_by_filename(
         - filename="06_2025" (imports from 06_2025_main.parquet and 06_2025_dual.parquet)
         - filename="08_2025" (imports from 08_2025_main.parquet and 08_2025_dual.parquet)
     """
-    import re
-    
     try:
-        # Parse month and year from filename
-        pattern = r'^(\d{2})_(\d{4})$'
-        match = re.match(pattern, filename)
-        
-        if not match:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid filename format. Expected format: mm_yyyy (e.g., 06_2025). Got: {filename}"
-            )
-        
-        month = int(match.group(1))
-        year = int(match.group(2))
-        
-        # Validate month and year
-        if not (1 <= month <= 12):
-            raise HTTPException(status_code=400, detail=f"Month must be between 01 and 12. Got: {month:02d}")
-        
-        if year < 2000 or year > 2030:
-            raise HTTPException(status_code=400, detail=f"Year must be between 2000 and 2030. Got: {year}")
+        # Filename format, month and year range are already enforced by the Query pattern
+        month = int(filename[0:2])
+        year = int(filename[3:7])
         
         # Construct Parquet file paths
-        data_folder = Path("Data")
+        data_folder = _DATA_FOLDER
         main_parquet = data_folder / f"{filename}_main.parquet"
         dual_parquet = data_folder / f"{filename}_dual.parquet"
         
-        # Check if Parquet files exist
-        if not (main_parquet.exists() and dual_parquet.exists()):
-            if auto_convert:
-                # Try to find and convert the corresponding ODS file
-                ods_file = data_folder / f"{filename}.ods"
-                
-                if ods_file.exists():
-                    logger.info(f"Parquet files not found, auto-converting from ODS: {ods_file}")
-                    converter = ParquetConverter()
-                    conversion_result = converter.convert_ods_to_parquet(str(ods_file), str(data_folder))
-                    
-                    # Update paths to the newly created Parquet files
-                    main_parquet = Path(conversion_result["main_parquet"])
-                    dual_parquet = Path(conversion_result["dual_parquet"])
-                else:
+        ods_file = data_folder / f"{filename}.ods"
+        
+        # Claim the period first: a concurrent request for it gets a 409 instead of
+        # converting and writing the same Parquet files at the same time
+        import_key = f"{month:02d}_{year}"
+        _claim_import(import_key)
+        try:
+            if auto_convert and ods_file.exists():
+                # (Re)convert only if the Parquet files are missing or older than the ODS source
+                # Conversion is blocking and can take minutes; keep it off the event loop
+                conversion_result = await run_in_threadpool(_ensure_parquet, ods_file, data_folder)
+                main_parquet = Path(conversion_result["main_parquet"])
+                dual_parquet = Path(conversion_result["dual_parquet"])
+            elif not (main_parquet.exists() and dual_parquet.exists()):
+                if auto_convert:
                     raise HTTPException(
                         status_code=404,
                         detail=f"Neither Parquet files nor ODS source file found. Missing: {main_parquet}, {dual_parquet}, {ods_file}"
                     )
-            else:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Parquet files not found: {main_parquet}, {dual_parquet}. Set auto_convert=true to convert from ODS."
-                )
+                else:
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Parquet files not found: {main_parquet}, {dual_parquet}. Set auto_convert=true to convert from ODS."
+                    )
         
-        # Validate Parquet files
-        converter = ParquetConverter()
-        if not converter.validate_parquet_files(str(main_parquet), str(dual_parquet)):
-            raise HTTPException(status_code=400, detail="Parquet file validation failed")
+            # Validate Parquet files
+            converter = ParquetConverter()
+            if not converter.validate_parquet_files(str(main_parquet), str(dual_parquet)):
+                raise HTTPException(status_code=400, detail="Parquet file validation failed")
+        except BaseException:
+            _release_import((import_key,))
+            raise
         
         if run_in_background:
-            background_tasks.add_task(
+            _submit_import(
+                (import_key,),
                 import_parquet_background, 
                 str(main_parquet), 
                 str(dual_parquet), 
-                db, 
                 filter_care_homes, 
                 year, 
                 month
             )
             
-            filter_msg = ""
-            if filter_care_homes is True:
-                filter_msg = " (care homes only)"
-            elif filter_care_homes is False:
-                filter_msg = " (non-care homes only)"
-            
-            return {
-                "message": f"Parquet import started in background{filter_msg}",
-                "filename": filename,
-                "main_parquet": str(main_parquet),
-                "dual_parquet": str(dual_parquet),
-                "year": year,
-                "month": month,
-                "filter_care_homes": filter_care_homes,
-                "status": "running"
-            }
-        
-        # Run import synchronously
-        importer = CQCDataImporter(db)
-        stats = importer.import_from_parquet(str(main_parquet), str(dual_parquet), filter_care_homes, year, month)
+            return _import_response(
+                "Parquet import started in background",
+                filter_care_homes,
+                status=_queued_or_running(),
+                filename=filename,
+                main_parquet=str(main_parquet),
+                dual_parquet=str(dual_parquet),
+                year=year,
+                month=month
+            )
         
-        filter_msg = ""
-        if filter_care_homes is True:
-            filter_msg = " (care homes only)"
-        elif filter_care_homes is False:
-            filter_msg = " (non-care homes only)"
+        # Run the import on the import worker with its own session; this request only waits on the result
+        future = _submit_import((import_key,), run_parquet_import, str(main_parquet), str(dual_parquet), filter_care_homes, year, month)
+        try:
+            stats = await _wait_for_import(future)
+        except asyncio.TimeoutError:
+            raise HTTPException(
+                status_code=504,
+                detail=f"Import exceeded {SYNC_IMPORT_TIMEOUT_SECONDS // 60} minutes and is still running; check /import-progress for progress"
+            )
         
-        return {
-            "message": f"Parquet import completed{filter_msg}",
-            "filename": filename,
-            "main_parquet": str(main_parquet),
-            "dual_parquet": str(dual_parquet),
-            "year": year,
-            "month": month,
-            "filter_care_homes": filter_care_homes,
-            "status": "completed",
-            "statistics": stats
-        }
+        return _import_response(
+            "Parquet import completed",
+            filter_care_homes,
+            filename=filename,
+            main_parquet=str(main_parquet),
+            dual_parquet=str(dual_parquet),
+            year=year,
+            month=month,
+            statistics=stats
+        )
         
     except HTTPException:
         raise
@@ -790,8 +994,14 @@ def import_parquet_by_filename(
         raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
 
 
-@router.get("/import-status")
-async def get_import_status(import_id: str = None):
+def _load_import_status(import_id: Optional[str]) -> Tuple[Optional[Dict[str, Any]], str]:
+    """Tracker status plus an ETag over its content, computed once per cache window"""
+    status = import_tracker.get_status(import_id)
+    return status, make_etag("import-status", import_id, orjson.dumps(status, option=orjson.OPT_SORT_KEYS))
+
+
+@router.get("/import-progress")
+async def get_import_status(request: Request, import_id: str = None):
     """
     Get the status of a running or completed import operation.
     
@@ -802,111 +1012,86 @@ async def get_import_status(import_id: str = None):
         Current import status with progress information
         
     Example:
-        GET /api/v1/data/import-status?import_id=import_1724798400
+        GET /api/v1/data/import-progress?import_id=import_1724798400
+    
+    Reads only the in-process tracker (cached for IMPORT_STATUS_TTL_SECONDS);
+    no database session is taken. Responses carry an ETag with no-cache, so
+    pollers revalidate each time and get a bodiless 304 while nothing changed.
     """
     try:
-        status = import_tracker.get_status(import_id)
+        status, etag = _import_status_cache.get_or_set(import_id, lambda: _load_import_status(import_id))
+        cached = not_modified(request, etag, REVALIDATE_CACHE_CONTROL)
+        if cached:
+            return cached
         
         if not status:
-            return {
+            return cacheable_response({
                 "message": "No import status found",
                 "import_id": import_id,
                 "status": "not_found"
-            }
+            }, etag, REVALIDATE_CACHE_CONTROL)
         
-        return {
+        return cacheable_response({
             "message": "Import status retrieved successfully", 
             "import_status": status
-        }
+        }, etag, REVALIDATE_CACHE_CONTROL)
         
     except Exception as e:
         logger.error(f"Failed to get import status: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to get import status: {str(e)}")
 
 
-def import_multiple_files_background(filenames: List[str], db: Session, filter_care_homes: bool = None):
-    """Background task to import multiple data files sequentially"""
-    import_results = []
-    total_stats = {
-        "brands_created": 0,
-        "providers_created": 0,
-        "locations_created": 0,
-        "location_period_data_created": 0,
-        "activities_created": 0,
-        "service_types_created": 0,
-        "user_bands_created": 0,
-        "periods_created": 0,
-        "errors": []
-    }
+def import_multiple_files_background(jobs: List[Tuple[str, Path, int, int]], filter_care_homes: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    Background task to import multiple data files sequentially on its own session.
+    
+    jobs are (filename, file_path, year, month) tuples already validated by the endpoint.
+    Returns the aggregate summary (also recorded in the import tracker).
+    
+    Files are imported one at a time, in order, but the next file's Parquet
+    conversion (CPU-bound, in the conversion process pool) is started before the
+    current file's import (DB-bound), so conversion time hides behind the import.
+    """
+    db = SessionLocal()
+    successful_imports = 0
+    failed_imports = 0
+    totals = Counter(dict.fromkeys(_MULTI_IMPORT_STAT_KEYS, 0))
+    errors: List[str] = []
+    
+    conversions: Dict[int, Future] = {}
     
+    def summary() -> Dict[str, Any]:
+        return {
+            "files_processed": successful_imports + failed_imports,
+            "successful_imports": successful_imports,
+            "failed_imports": failed_imports,
+            "total_statistics": {**totals, "errors": errors}
+        }
+    
+    def start_conversion(index: int) -> None:
+        if index < len(jobs):
+            file_path = jobs[index][1]
+            conversions[index] = conversion_prefetch.submit(_ensure_parquet, file_path, file_path.parent)
+    
+    conversion_prefetch = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cqc-convert")
     try:
-        import re
-        import os
-        from pathlib import Path
+        # Progress is published to the tracker after every file, so /import-progress
+        # follows the run and per-file stats are not kept until the end
+        total_size_mb = sum(file_path.stat().st_size for _, file_path, _, _ in jobs) / (1024*1024)
+        import_id = import_tracker.start_import(", ".join(job[0] for job in jobs), total_size_mb)
+        logger.info(f"📊 Import tracking ID: {import_id}")
+        import_tracker.update_phase("data_import", f"Importing {len(jobs)} files", 0)
         
-        for i, filename in enumerate(filenames, 1):
-            logger.info(f"Processing file {i}/{len(filenames)}: {filename}")
+        start_conversion(0)
+        for index, (filename, file_path, year, month) in enumerate(jobs):
+            logger.info(f"Processing file {index + 1}/{len(jobs)}: {filename}")
+            stats = None
+            
+            # Convert the next file while this one is imported
+            start_conversion(index + 1)
             
             try:
-                # Parse month and year from filename (support both .ods and .xlsx)
-                pattern = r'^(\d{2})_(\d{4})\.(ods|xlsx)$'
-                match = re.match(pattern, filename)
-                
-                if not match:
-                    error_msg = f"Invalid filename format: {filename}. Expected format: mm_yyyy.ods or mm_yyyy.xlsx"
-                    logger.error(error_msg)
-                    import_results.append({
-                        "filename": filename,
-                        "status": "failed",
-                        "error": error_msg
-                    })
-                    total_stats["errors"].append(error_msg)
-                    continue
-                
-                month = int(match.group(1))
-                year = int(match.group(2))
-                
-                # Validate month and year
-                if not (1 <= month <= 12):
-                    error_msg = f"Invalid month in filename {filename}: {month:02d}. Month must be between 01 and 12"
-                    logger.error(error_msg)
-                    import_results.append({
-                        "filename": filename,
-                        "status": "failed",
-                        "error": error_msg
-                    })
-                    total_stats["errors"].append(error_msg)
-                    continue
-                
-                if year < 2000 or year > 2030:
-                    error_msg = f"Invalid year in filename {filename}: {year}. Year must be between 2000 and 2030"
-                    logger.error(error_msg)
-                    import_results.append({
-                        "filename": filename,
-                        "status": "failed",
-                        "error": error_msg
-                    })
-                    total_stats["errors"].append(error_msg)
-                    continue
-                
-                # Construct file path
-                data_folder = Path("Data")
-                file_path = data_folder / filename
-                
-                if not file_path.exists():
-                    error_msg = f"File not found: {file_path}"
-                    logger.error(error_msg)
-                    import_results.append({
-                        "filename": filename,
-                        "status": "failed",
-                        "error": error_msg
-                    })
-                    total_stats["errors"].append(error_msg)
-                    continue
-                
-                # Convert to Parquet files for faster processing
-                converter = ParquetConverter()
-                conversion_result = converter.convert_ods_to_parquet(str(file_path), str(data_folder))
+                conversion_result = conversions.pop(index).result()
                 
                 main_parquet = conversion_result["main_parquet"]
                 dual_parquet = conversion_result["dual_parquet"]
@@ -916,61 +1101,52 @@ def import_multiple_files_background(filenames: List[str], db: Session, filter_c
                 stats = importer.import_from_parquet(main_parquet, dual_parquet, filter_care_homes, year, month)
                 
                 # Add to totals
-                for key in ["brands_created", "providers_created", "locations_created", 
-                          "location_period_data_created",
-                          "activities_created", "service_types_created", "user_bands_created", 
-                          "periods_created"]:
-                    total_stats[key] += stats.get(key, 0)
+                totals.update({key: stats.get(key, 0) for key in _MULTI_IMPORT_STAT_KEYS})
                 
                 if stats.get("errors"):
-                    total_stats["errors"].extend(stats["errors"])
-                
-                import_results.append({
-                    "filename": filename,
-                    "year": year,
-                    "month": month,
-                    "status": "completed",
-                    "stats": stats
-                })
+                    errors.extend(stats["errors"])
                 
+                successful_imports += 1
                 logger.info(f"Successfully imported {filename}: {stats}")
                 
             except Exception as file_error:
                 error_msg = f"Failed to import {filename}: {str(file_error)}"
                 logger.error(error_msg)
-                import_results.append({
-                    "filename": filename,
-                    "status": "failed",
-                    "error": error_msg
-                })
-                total_stats["errors"].append(error_msg)
-        
-        logger.info(f"Multi-file import completed. Processed {len(filenames)} files. Total stats: {total_stats}")
-        
-        # Store results in import tracker
-        import_id = f"multi_import_{int(__import__('time').time())}"
-        import_tracker.set_import_status(import_id, {
-            "status": "completed",
-            "files_processed": len(filenames),
-            "successful_imports": len([r for r in import_results if r["status"] == "completed"]),
-            "failed_imports": len([r for r in import_results if r["status"] == "failed"]),
-            "import_results": import_results,
-            "total_statistics": total_stats
-        })
+                failed_imports += 1
+                errors.append(error_msg)
+            
+            import_tracker.update_details(
+                current_step=f"Processed {index + 1}/{len(jobs)} files",
+                progress=int(100 * (index + 1) / len(jobs)),
+                files_processed=index + 1,
+                successful_imports=successful_imports,
+                failed_imports=failed_imports,
+                last_file=filename,
+                last_stats=stats
+            )
+        
+        logger.info(f"Multi-file import completed. Processed {len(jobs)} files. Total stats: {summary()['total_statistics']}")
+        
+        import_tracker.complete_phase("data_import")
+        import_tracker.complete_import(summary())
         
     except Exception as e:
         error_msg = f"Multi-file import failed: {str(e)}"
         logger.error(error_msg)
-        total_stats["errors"].append(error_msg)
+        errors.append(error_msg)
+        import_tracker.fail_import(error_msg)
+    finally:
+        conversion_prefetch.shutdown(wait=False, cancel_futures=True)
+        db.close()
+        invalidate_reference_cache()
+    return summary()
 
 
 @router.post("/import-multiple-files")
-def import_multiple_files(
-    background_tasks: BackgroundTasks,
+async def import_multiple_files(
     filenames: List[str] = Query(..., description="List of filenames in format mm_yyyy.ods or mm_yyyy.xlsx (e.g., ['01_2025.ods', '02_2025.xlsx'])"),
     run_in_background: bool = Query(False, description="Run import in background"),
-    filter_care_homes: bool = Query(None, description="Filter: True=care homes only, False=non-care homes only, None=all"),
-    db: Session = Depends(get_db)
+    filter_care_homes: Optional[bool] = Query(None, description="Filter: True=care homes only, False=non-care homes only, None=all")
 ) -> Dict[str, Any]:
     """
     Import multiple CQC data files sequentially from Data folder with Parquet optimization.
@@ -1000,12 +1176,14 @@ def import_multiple_files(
     if len(filenames) > 50:  # Reasonable limit to prevent abuse
         raise HTTPException(status_code=400, detail="Cannot process more than 50 files at once")
     
-    # Validate all filenames before starting
-    import re
-    pattern = r'^(\d{2})_(\d{4})\.(ods|xlsx)$'
+    duplicates = sorted(filename for filename, count in Counter(filenames).items() if count > 1)
+    if duplicates:
+        raise HTTPException(status_code=400, detail=f"Duplicate filenames: {', '.join(duplicates)}")
     
+    # Validate all filenames before starting; the background import reuses the parsed values
+    jobs = []
     for filename in filenames:
-        match = re.match(pattern, filename)
+        match = _MULTI_FILENAME_RE.match(filename)
         if not match:
             raise HTTPException(
                 status_code=400,
@@ -1020,14 +1198,12 @@ def import_multiple_files(
         
         if year < 2000 or year > 2030:
             raise HTTPException(status_code=400, detail=f"Invalid year in {filename}: {year}. Year must be between 2000 and 2030")
+        
+        jobs.append((filename, _DATA_FOLDER / filename, year, month))
     
-    # Check if all files exist before starting
-    data_folder = Path("Data")
-    missing_files = []
-    for filename in filenames:
-        file_path = data_folder / filename
-        if not file_path.exists():
-            missing_files.append(str(file_path))
+    # Check if all files exist before starting: one (cached) folder scan instead of a stat per file
+    existing = {info.filename for info in _scan_data_folder()} if _DATA_FOLDER.exists() else set()
+    missing_files = [str(file_path) for filename, file_path, _, _ in jobs if filename not in existing]
     
     if missing_files:
         raise HTTPException(
@@ -1035,40 +1211,44 @@ def import_multiple_files(
             detail=f"Files not found: {', '.join(missing_files)}"
         )
     
+    # Claim every period in the batch so single-file imports of the same months get a 409
+    import_keys = tuple(dict.fromkeys(f"{month:02d}_{year}" for _, _, year, month in jobs))
+    _claim_import(*import_keys)
+    
     if run_in_background:
-        background_tasks.add_task(
+        _submit_import(
+            import_keys,
             import_multiple_files_background,
-            filenames,
-            db,
+            jobs,
             filter_care_homes
         )
         
-        filter_msg = ""
-        if filter_care_homes is True:
-            filter_msg = " (care homes only)"
-        elif filter_care_homes is False:
-            filter_msg = " (non-care homes only)"
-        
-        return {
-            "message": f"Multi-file Parquet import started in background{filter_msg}",
-            "filenames": filenames,
-            "total_files": len(filenames),
-            "status": "running",
-            "optimization": "Each file will be converted to Parquet format for faster processing"
-        }
-    else:
-        # Run synchronously
-        import_multiple_files_background(filenames, db, filter_care_homes)
-        
-        filter_msg = ""
-        if filter_care_homes is True:
-            filter_msg = " (care homes only)"
-        elif filter_care_homes is False:
-            filter_msg = " (non-care homes only)"
-        
-        return {
-            "message": f"Multi-file Parquet import completed{filter_msg}",
-            "filenames": filenames,
-            "total_files": len(filenames),
-            "status": "completed"
-        }
\ No newline at end of file
+        return _import_response(
+            "Multi-file Parquet import started in background",
+            filter_care_homes,
+            status=_queued_or_running(),
+            filenames=filenames,
+            total_files=len(filenames),
+            optimization="Each file will be converted to Parquet format for faster processing"
+        )
+    
+    # Run the files on the import worker like any other import; this request only waits on the result
+    future = _submit_import(import_keys, import_multiple_files_background, jobs, filter_care_homes)
+    try:
+        import_summary = await _wait_for_import(future)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail=f"Multi-file import exceeded {SYNC_IMPORT_TIMEOUT_SECONDS // 60} minutes and is still running; check /import-progress for progress"
+        )
+    except Exception as e:
+        logger.error(f"Multi-file import failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Multi-file import failed: {str(e)}")
+    
+    return _import_response(
+        "Multi-file Parquet import completed",
+        filter_care_homes,
+        filenames=filenames,
+        total_files=len(filenames),
+        import_statistics=import_summary
+    )
\ No newline at end of file
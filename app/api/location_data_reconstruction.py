@@ -1,115 +1,153 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from operator import itemgetter
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import TextClause
 from typing import Dict, Any, List, Optional
 import logging
-from app.core.database import get_db
-from app.models.regulated_activity import RegulatedActivity
-from app.models.service_type import ServiceType  
-from app.models.service_user_band import ServiceUserBand
+from app.core.database import get_async_db
+from app.utils.http_cache import async_data_version, cacheable_response, make_etag, not_modified
 
-router = APIRouter()
+# orjson for every route: wide 60+ field records encode several times faster than stdlib json.
+# Handlers run on the asyncpg engine so waiting on Postgres never holds a threadpool worker
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 
-def reconstruct_boolean_columns(db: Session, location_id: str, period_id: int = None) -> Dict[str, str]:
+# Fields are joined with four spaces (not tabs) to match the original flat format
+FLAT_SEPARATOR = "    "
+
+# Original flat-format column order as (key, default) pairs
+_FLAT_FIELDS = [
+    ("location_id", ""),
+    ("location_hsca_start_date", ""),
+    ("is_dormant", "N"),
+    ("is_care_home", "N"),
+    ("location_name", ""),
+    ("location_ods_code", ""),
+    ("location_telephone_number", ""),
+    ("registered_manager", ""),
+    ("registered_manager_raw", ""),
+    ("care_homes_beds", ""),
+    ("location_type_sector", ""),
+    ("location_inspection_directorate", ""),
+    ("location_primary_inspection_category", ""),
+    ("latest_overall_rating", ""),
+    ("publication_date", ""),
+    ("is_inherited_rating", "N"),
+    ("location_region", ""),
+    ("location_nhs_region", ""),
+    ("location_local_authority", ""),
+    ("location_onspd_ccg_code", ""),
+    ("location_onspd_ccg", ""),
+    ("location_commissioning_ccg_code", ""),
+    ("location_commissioning_ccg", ""),
+    ("location_street_address", ""),
+    ("location_address_line_2", ""),
+    ("location_city", ""),
+    ("location_county", ""),
+    ("location_postal_code", ""),
+    ("location_paf_id", ""),
+    ("location_uprn_id", ""),
+    ("location_latitude", ""),
+    ("location_longitude", ""),
+    ("location_parliamentary_constituency", ""),
+    ("companies_house_number", ""),
+    ("brand_id", ""),
+    ("provider_id", ""),
+    ("provider_name", ""),
+    ("provider_hsca_start_date", ""),
+    ("provider_type_sector", ""),
+    ("provider_inspection_directorate", ""),
+    ("provider_primary_inspection_category", ""),
+    ("ownership_type", ""),
+    ("provider_telephone_number", ""),
+    ("provider_web_address", ""),
+    ("provider_street_address", ""),
+    ("provider_address_line_2", ""),
+    ("provider_city", ""),
+    ("provider_county", ""),
+    ("provider_postal_code", ""),
+    ("provider_paf_id", ""),
+    ("provider_uprn_id", ""),
+    ("provider_local_authority", ""),
+    ("provider_region", ""),
+    ("provider_nhs_region", ""),
+    ("provider_latitude", ""),
+    ("provider_longitude", ""),
+    ("provider_parliamentary_constituency", ""),
+    ("nominated_individual_name", ""),
+    ("provider_nominated_individual_name_raw", ""),
+    ("provider_main_partner_name", "*"),
+    ("provider_main_partner_name_raw", ""),
+]
+
+# Fields are pulled in one itemgetter call over the row layered on these defaults
+_FLAT_DEFAULTS = dict(_FLAT_FIELDS)
+_flat_values = itemgetter(*_FLAT_DEFAULTS)
+
+# Activity flag slots rendered as "Y" when set, blank otherwise. These keys are not
+# reconstructed columns (those are keyed by the original header names), so the flat
+# endpoint skips the boolean columns and the slots stay blank
+_FLAT_FLAGS = [
+    "accommodation_nursing_personal_care",
+    "treatment_disease_disorder_injury",
+]
+
+
+def _boolean_flags_sql(period_condition: str) -> str:
     """
-    Dynamically reconstruct all boolean columns from association tables.
-    Returns a dictionary with original column names and Y/N values.
+    SQL for every regulated activity, service type and service user band as
+    its original column name with a Y/N flag for the location in the `loc` CTE.
+
+    On duplicate names the later section wins.
     """
-    boolean_columns = {}
-    
-    # Get all regulated activities and check which ones this location has
-    activities = db.query(RegulatedActivity).all()
-    for activity in activities:
-        # Query if this location has this activity for the period
-        if period_id:
-            has_activity = db.execute(
-                text("SELECT 1 FROM location_regulated_activities WHERE location_id = :location_id AND activity_id = :activity_id AND period_id = :period_id"),
-                {"location_id": location_id, "activity_id": activity.activity_id, "period_id": period_id}
-            ).fetchone()
-        else:
-            has_activity = db.execute(
-                text("SELECT 1 FROM location_regulated_activities WHERE location_id = :location_id AND activity_id = :activity_id"),
-                {"location_id": location_id, "activity_id": activity.activity_id}
-            ).fetchone()
-        
-        # Store as original column name with Y/N value
-        boolean_columns[activity.activity_name] = "Y" if has_activity else "N"
-    
-    # Get all service types and check which ones this location has
-    service_types = db.query(ServiceType).all()
-    for service_type in service_types:
-        if period_id:
-            has_service = db.execute(
-                text("SELECT 1 FROM location_service_types WHERE location_id = :location_id AND service_type_id = :service_type_id AND period_id = :period_id"),
-                {"location_id": location_id, "service_type_id": service_type.service_type_id, "period_id": period_id}
-            ).fetchone()
-        else:
-            has_service = db.execute(
-                text("SELECT 1 FROM location_service_types WHERE location_id = :location_id AND service_type_id = :service_type_id"),
-                {"location_id": location_id, "service_type_id": service_type.service_type_id}
-            ).fetchone()
-        
-        # Store as original column name with Y/N value
-        boolean_columns[service_type.service_type_name] = "Y" if has_service else "N"
-    
-    # Get all service user bands and check which ones this location has
-    user_bands = db.query(ServiceUserBand).all()
-    for band in user_bands:
-        if period_id:
-            has_band = db.execute(
-                text("SELECT 1 FROM location_service_user_bands WHERE location_id = :location_id AND band_id = :band_id AND period_id = :period_id"),
-                {"location_id": location_id, "band_id": band.band_id, "period_id": period_id}
-            ).fetchone()
-        else:
-            has_band = db.execute(
-                text("SELECT 1 FROM location_service_user_bands WHERE location_id = :location_id AND band_id = :band_id"),
-                {"location_id": location_id, "band_id": band.band_id}
-            ).fetchone()
-        
-        # Store as original column name with Y/N value
-        boolean_columns[band.band_name] = "Y" if has_band else "N"
-    
-    return boolean_columns
+    sections = [
+        ("location_regulated_activities", "regulated_activities", "activity_id", "activity_name"),
+        ("location_service_types", "service_types", "service_type_id", "service_type_name"),
+        ("location_service_user_bands", "service_user_bands", "band_id", "band_name"),
+    ]
+    selects = [
+        f"""
+                SELECT {kind} AS kind, d.{id_column} AS item_id, d.{name_column} AS column_name,
+                       EXISTS (
+                           SELECT 1 FROM {link_table} x
+                           WHERE x.location_id = loc.location_id AND x.{id_column} = d.{id_column}{period_condition}
+                       ) AS present
+                FROM {lookup_table} d, loc"""
+        for kind, (link_table, lookup_table, id_column, name_column) in enumerate(sections)
+    ]
+    return "\n                UNION ALL".join(selects)
 
 
-@router.get("/reconstruct-original/{location_id}")
-def reconstruct_original_data(
-    location_id: str,
-    year: Optional[int] = Query(None, description="Year of data period"),
-    month: Optional[int] = Query(None, description="Month of data period"),
-    db: Session = Depends(get_db)
-) -> Dict[str, Any]:
-    """
-    Reconstruct the original flat CQC data format for a specific location.
-    Returns data in the exact format as it appears in the original Excel files.
+def _reconstruct_query(filter_year: bool, filter_month: bool, with_flags: bool) -> TextClause:
+    """Build the reconstruct query for one combination of year/month filters, with or without boolean columns"""
+    # Build the WHERE clause based on provided filters
+    where_conditions = ["l.location_id = :location_id"]
+    if filter_year:
+        where_conditions.append("dp.year = :year")
+    if filter_month:
+        where_conditions.append("dp.month = :month")
+    where_clause = " AND ".join(where_conditions)
     
-    Args:
-        location_id: The CQC location ID (e.g., '1-1000587219')
-        year: Optional year filter (e.g., 2025)
-        month: Optional month filter (1-12)
+    # Boolean columns follow the period of the reconstructed row when one was requested
+    period_condition = " AND x.period_id = loc.period_id" if filter_year or filter_month else ""
+    flags_sql = f"""
+            flags AS ({_boolean_flags_sql(period_condition)}
+            )
+            SELECT loc.*,
+                   (SELECT COALESCE(
+                        json_object_agg(column_name, CASE WHEN present THEN 'Y' ELSE 'N' END ORDER BY kind, item_id),
+                        json_build_object()
+                    ) FROM flags) AS boolean_columns
+            FROM loc""" if with_flags else """
+            SELECT loc.* FROM loc"""
     
-    Returns:
-        Original format data for the location
-    """
-    try:
-        # Build the WHERE clause based on provided filters
-        where_conditions = ["l.location_id = :location_id"]
-        params = {"location_id": location_id}
-        
-        if year is not None:
-            where_conditions.append("dp.year = :year")
-            params["year"] = year
-            
-        if month is not None:
-            where_conditions.append("dp.month = :month") 
-            params["month"] = month
-            
-        where_clause = " AND ".join(where_conditions)
-        
-        # Comprehensive query to reconstruct original format
-        query = text(f"""
+    # Comprehensive query to reconstruct original format, boolean columns included,
+    # in a single round trip
+    return text(f"""
+            WITH loc AS (
             SELECT 
                 -- Fields 1-10: Location identification and basic info
                 l.location_id,
@@ -151,33 +189,33 @@ def reconstruct_original_data(
                 l.location_parliamentary_constituency,
                 
                 -- Fields 31-40: Provider information
-                p.companies_house_number,
-                p.brand_id,
+                p.provider_companies_house_number as companies_house_number,
+                pb.brand_id,
                 p.provider_id,
                 p.provider_name,
-                p.hsca_start_date as provider_hsca_start_date,
-                p.type_sector as provider_type_sector,
-                p.inspection_directorate as provider_inspection_directorate,
-                p.primary_inspection_category as provider_primary_inspection_category,
-                p.ownership_type,
-                p.telephone_number as provider_telephone_number,
+                p.provider_hsca_start_date,
+                p.provider_type_sector,
+                p.provider_inspection_directorate,
+                p.provider_primary_inspection_category,
+                p.provider_ownership_type as ownership_type,
+                p.provider_telephone_number,
                 
                 -- Fields 41-55: Provider address and contact
-                p.web_address as provider_web_address,
-                p.street_address as provider_street_address,
-                p.address_line_2 as provider_address_line_2,
-                p.city as provider_city,
-                p.county as provider_county,
-                p.postal_code as provider_postal_code,
-                p.paf_id as provider_paf_id,
-                p.uprn_id as provider_uprn_id,
-                p.local_authority as provider_local_authority,
-                p.region as provider_region,
-                p.nhs_region as provider_nhs_region,
-                p.latitude as provider_latitude,
-                p.longitude as provider_longitude,
-                p.parliamentary_constituency as provider_parliamentary_constituency,
-                p.nominated_individual_name,
+                p.provider_web_address,
+                p.provider_street_address,
+                p.provider_address_line_2,
+                p.provider_city,
+                p.provider_county,
+                p.provider_postal_code,
+                p.provider_paf_id,
+                p.provider_uprn_id,
+                p.provider_local_authority,
+                p.provider_region,
+                p.provider_nhs_region,
+                p.provider_latitude,
+                p.provider_longitude,
+                p.provider_parliamentary_constituency,
+                p.provider_nominated_individual_name as nominated_individual_name,
                 p.provider_nominated_individual_name_raw,
                 p.provider_main_partner_name,
                 p.provider_main_partner_name_raw,
@@ -188,56 +226,88 @@ def reconstruct_original_data(
                 -- Period information
                 dp.year,
                 dp.month,
-                dp.file_name
+                dp.file_name,
+                lpd.period_id
                 
             FROM locations l
             LEFT JOIN location_period_data lpd ON l.location_id = lpd.location_id
             LEFT JOIN data_periods dp ON lpd.period_id = dp.period_id
             LEFT JOIN providers p ON l.provider_id = p.provider_id
-            LEFT JOIN brands b ON p.brand_id = b.brand_id
+            LEFT JOIN provider_brands pb ON pb.provider_id = p.provider_id AND pb.period_id = lpd.period_id
+            LEFT JOIN brands b ON pb.brand_id = b.brand_id
             WHERE {where_clause}
             ORDER BY dp.year DESC, dp.month DESC
-        """)
-        
-        result = db.execute(query, params).fetchone()
-        
-        if not result:
-            raise HTTPException(status_code=404, detail=f"Location {location_id} not found for the specified period")
-        
-        # Convert result to dictionary
-        result_dict = result._asdict()
-        
-        # Get the period_id for dynamic boolean reconstruction
-        period_id = None
-        if year is not None or month is not None:
-            period_query = text("SELECT period_id FROM data_periods WHERE 1=1")
-            period_params = {}
-            
-            conditions = []
-            if year is not None:
-                conditions.append("year = :year")
-                period_params["year"] = year
-            if month is not None:
-                conditions.append("month = :month") 
-                period_params["month"] = month
-                
-            if conditions:
-                period_query = text(f"SELECT period_id FROM data_periods WHERE {' AND '.join(conditions)}")
-                period_result = db.execute(period_query, period_params).fetchone()
-                if period_result:
-                    period_id = period_result[0]
-        
-        # Dynamically reconstruct all boolean columns from association tables
-        boolean_columns = reconstruct_boolean_columns(db, location_id, period_id)
+            LIMIT 1
+            ){"," if with_flags else ""}{flags_sql}
+    """)
+
+
+# Only four WHERE shapes exist (each with and without boolean columns), so build each
+# statement once and reuse it; a fixed SQL string per shape also keeps the
+# driver/server statement caches warm
+_RECONSTRUCT_QUERIES = {
+    (filter_year, filter_month, with_flags): _reconstruct_query(filter_year, filter_month, with_flags)
+    for filter_year in (False, True)
+    for filter_month in (False, True)
+    for with_flags in (False, True)
+}
+
+
+async def _fetch_reconstructed(location_id: str, year: Optional[int], month: Optional[int], db: AsyncSession,
+                               with_flags: bool = True) -> Dict[str, Any]:
+    """Run the reconstruct query and return the row, with its boolean columns merged in when with_flags"""
+    params = {"location_id": location_id}
+    if year is not None:
+        params["year"] = year
+    if month is not None:
+        params["month"] = month
+    query = _RECONSTRUCT_QUERIES[(year is not None, month is not None, with_flags)]
+    
+    result = (await db.execute(query, params)).fetchone()
+    
+    if not result:
+        raise HTTPException(status_code=404, detail=f"Location {location_id} not found for the specified period")
+    
+    # Convert result to dictionary, boolean columns after the fixed fields
+    result_dict = result._asdict()
+    result_dict.pop("period_id")
+    result_dict.update(result_dict.pop("boolean_columns", {}))
+    return result_dict
+
+
+@router.get("/reconstruct-original/{location_id}")
+async def reconstruct_original_data(
+    request: Request,
+    location_id: str,
+    year: Optional[int] = Query(None, description="Year of data period"),
+    month: Optional[int] = Query(None, description="Month of data period"),
+    db: AsyncSession = Depends(get_async_db)
+) -> Dict[str, Any]:
+    """
+    Reconstruct the original flat CQC data format for a specific location.
+    Returns data in the exact format as it appears in the original Excel files.
+    
+    Args:
+        location_id: The CQC location ID (e.g., '1-1000587219')
+        year: Optional year filter (e.g., 2025)
+        month: Optional month filter (1-12)
+    
+    Returns:
+        Original format data for the location
+    """
+    try:
+        etag = make_etag("reconstruct-original", location_id, year, month, await async_data_version(db))
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
         
-        # Add boolean columns to result
-        result_dict.update(boolean_columns)
+        data = await _fetch_reconstructed(location_id, year, month, db)
         
-        return {
+        return cacheable_response({
             "status": "success",
             "location_id": location_id,
-            "reconstructed_data": result_dict
-        }
+            "reconstructed_data": data
+        }, etag)
         
     except HTTPException:
         raise
@@ -247,100 +317,41 @@ def reconstruct_original_data(
 
 
 @router.get("/reconstruct-original-flat/{location_id}")  
-def reconstruct_original_flat_format(
+async def reconstruct_original_flat_format(
+    request: Request,
     location_id: str,
     year: Optional[int] = Query(None),
     month: Optional[int] = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Reconstruct the original flat format as a single delimited string,
     exactly matching the format you provided in your example.
     """
     try:
-        # Get the reconstructed data
-        data_response = reconstruct_original_data(location_id, year, month, db)
-        data = data_response["reconstructed_data"]
+        etag = make_etag("reconstruct-original-flat", location_id, year, month, await async_data_version(db))
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+        
+        # Get the reconstructed data; the flat layout has no use for the boolean columns
+        data = await _fetch_reconstructed(location_id, year, month, db, with_flags=False)
         
-        # Format as the original flat string with tab separations
-        flat_fields = [
-            str(data.get("location_id", "")),
-            str(data.get("location_hsca_start_date", "")),
-            str(data.get("is_dormant", "N")),  
-            str(data.get("is_care_home", "N")),
-            str(data.get("location_name", "")),
-            str(data.get("location_ods_code", "")),
-            str(data.get("location_telephone_number", "")),
-            str(data.get("registered_manager", "")),
-            str(data.get("registered_manager_raw", "")),
-            str(data.get("care_homes_beds", "")),
-            str(data.get("location_type_sector", "")),
-            str(data.get("location_inspection_directorate", "")),
-            str(data.get("location_primary_inspection_category", "")),
-            str(data.get("latest_overall_rating", "")),
-            str(data.get("publication_date", "")),
-            str(data.get("is_inherited_rating", "N")),
-            str(data.get("location_region", "")),
-            str(data.get("location_nhs_region", "")),
-            str(data.get("location_local_authority", "")),
-            str(data.get("location_onspd_ccg_code", "")),
-            str(data.get("location_onspd_ccg", "")),
-            str(data.get("location_commissioning_ccg_code", "")),
-            str(data.get("location_commissioning_ccg", "")),
-            str(data.get("location_street_address", "")),
-            str(data.get("location_address_line_2", "")),
-            str(data.get("location_city", "")),
-            str(data.get("location_county", "")),
-            str(data.get("location_postal_code", "")),
-            str(data.get("location_paf_id", "")),
-            str(data.get("location_uprn_id", "")),
-            str(data.get("location_latitude", "")),
-            str(data.get("location_longitude", "")),
-            str(data.get("location_parliamentary_constituency", "")),
-            str(data.get("companies_house_number", "")),
-            str(data.get("brand_id", "")),
-            str(data.get("provider_id", "")),
-            str(data.get("provider_name", "")),
-            str(data.get("provider_hsca_start_date", "")),
-            str(data.get("provider_type_sector", "")),
-            str(data.get("provider_inspection_directorate", "")),
-            str(data.get("provider_primary_inspection_category", "")),
-            str(data.get("ownership_type", "")),
-            str(data.get("provider_telephone_number", "")),
-            str(data.get("provider_web_address", "")),
-            str(data.get("provider_street_address", "")),
-            str(data.get("provider_address_line_2", "")),
-            str(data.get("provider_city", "")),
-            str(data.get("provider_county", "")),
-            str(data.get("provider_postal_code", "")),
-            str(data.get("provider_paf_id", "")),
-            str(data.get("provider_uprn_id", "")),
-            str(data.get("provider_local_authority", "")),
-            str(data.get("provider_region", "")),
-            str(data.get("provider_nhs_region", "")),
-            str(data.get("provider_latitude", "")),
-            str(data.get("provider_longitude", "")),
-            str(data.get("provider_parliamentary_constituency", "")),
-            str(data.get("nominated_individual_name", "")),
-            str(data.get("provider_nominated_individual_name_raw", "")),
-            str(data.get("provider_main_partner_name", "*")),
-            str(data.get("provider_main_partner_name_raw", "")),
-            # Activity flags (Y/N values)
-            "Y" if data.get("accommodation_nursing_personal_care") else "",
-            "Y" if data.get("treatment_disease_disorder_injury") else "",
-            # Add more activity flags as needed...
-        ]
+        # Format as the original flat string
+        flat_fields = list(map(str, _flat_values({**_FLAT_DEFAULTS, **data})))
+        flat_fields.extend("Y" if data.get(key) else "" for key in _FLAT_FLAGS)
         
-        # Join with multiple spaces to match your format
-        flat_string = "    ".join(flat_fields)
+        flat_string = FLAT_SEPARATOR.join(flat_fields)
         
-        return {
+        return cacheable_response({
             "status": "success", 
             "location_id": location_id,
             "original_flat_format": flat_string,
             "field_count": len(flat_fields)
-        }
+        }, etag)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to create flat format: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to create flat format: {str(e)}")
\ No newline at end of file
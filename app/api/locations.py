@@ -1,14 +1,22 @@
+import math
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.core.database import get_db
 from app.models.location import Location as LocationModel
 from app.schemas.location import Location, LocationCreate, LocationPeriodData
 from app.models.location_period_data import LocationPeriodData as LocationPeriodDataModel
-from app.models.data_period import DataPeriod
+from app.utils.reference_cache import get_period_id
 
 router = APIRouter()
 
+# Read-only list endpoints fetch plain rows of the locations table: no ORM entities,
+# identity map or attribute instrumentation; response models validate rows by attribute
+_LOCATIONS = LocationModel.__table__
+
+KM_PER_DEGREE = 111.0  # Rough km per degree of latitude
+
 
 @router.get("/", response_model=List[Location])
 def get_locations(
@@ -25,38 +33,31 @@ def get_locations(
 ):
     # Note: This endpoint now returns static location data only
     # For time-varying data (ratings, beds, etc.), use the filtering endpoint
-    query = db.query(LocationModel)
+    stmt = select(_LOCATIONS)
     
     if location_region:
-        query = query.filter(LocationModel.location_region == location_region)
+        stmt = stmt.where(LocationModel.location_region == location_region)
     if location_local_authority:
-        query = query.filter(LocationModel.location_local_authority == location_local_authority)
+        stmt = stmt.where(LocationModel.location_local_authority == location_local_authority)
     if location_type_sector:
-        query = query.filter(LocationModel.location_type_sector == location_type_sector)
+        stmt = stmt.where(LocationModel.location_type_sector == location_type_sector)
     
     # For time-varying filters, we need to join with period data
     if is_care_home is not None or latest_overall_rating:
         # Get the latest period or specific period
-        period_query = db.query(DataPeriod)
-        if year and month:
-            period_query = period_query.filter(DataPeriod.year == year, DataPeriod.month == month)
-        else:
-            period_query = period_query.order_by(DataPeriod.year.desc(), DataPeriod.month.desc())
-        
-        period = period_query.first()
-        if period:
-            query = query.join(
+        period_id = get_period_id(db, year, month)
+        if period_id is not None:
+            stmt = stmt.join(
                 LocationPeriodDataModel,
                 LocationModel.location_id == LocationPeriodDataModel.location_id
-            ).filter(LocationPeriodDataModel.period_id == period.period_id)
+            ).where(LocationPeriodDataModel.period_id == period_id)
             
             if is_care_home is not None:
-                query = query.filter(LocationPeriodDataModel.is_care_home == is_care_home)
+                stmt = stmt.where(LocationPeriodDataModel.is_care_home == is_care_home)
             if latest_overall_rating:
-                query = query.filter(LocationPeriodDataModel.latest_overall_rating == latest_overall_rating)
+                stmt = stmt.where(LocationPeriodDataModel.latest_overall_rating == latest_overall_rating)
     
-    locations = query.offset(skip).limit(limit).all()
-    return locations
+    return db.execute(stmt.offset(skip).limit(limit)).all()
 
 
 @router.get("/{location_id}", response_model=Location)
@@ -81,16 +82,21 @@ def get_nearby_locations(
     limit: int = Query(50, ge=1, le=500),
     db: Session = Depends(get_db)
 ):
-    # Simple bounding box search (for more precise distance, use PostGIS)
-    lat_offset = radius_km / 111.0  # Rough km to degree conversion
-    lng_offset = radius_km / (111.0 * abs(latitude))
+    # Bounding box search (for precise distance, use PostGIS); a degree of longitude
+    # shrinks with cos(latitude), so near the poles the box spans every longitude
+    lat_offset = radius_km / KM_PER_DEGREE
+    cos_latitude = math.cos(math.radians(latitude))
+    lng_offset = radius_km / (KM_PER_DEGREE * cos_latitude) if cos_latitude > 1e-6 else 180.0
     
-    locations = db.query(LocationModel).filter(
-        LocationModel.latitude.between(latitude - lat_offset, latitude + lat_offset),
-        LocationModel.longitude.between(longitude - lng_offset, longitude + lng_offset)
-    ).limit(limit).all()
+    # Same point() expression as ix_locations_point, so the box test is a GiST lookup
+    point = func.point(LocationModel.location_longitude, LocationModel.location_latitude)
+    box = func.box(
+        func.point(longitude - lng_offset, latitude - lat_offset),
+        func.point(longitude + lng_offset, latitude + lat_offset)
+    )
+    stmt = select(_LOCATIONS).where(point.op("<@")(box)).limit(limit)
     
-    return locations
+    return [dict(row) for row in db.execute(stmt).mappings()]
 
 
 @router.post("/", response_model=Location)
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.core.database import get_db
@@ -7,6 +8,9 @@ from app.schemas.provider import Provider, ProviderCreate
 
 router = APIRouter()
 
+# The list endpoint fetches plain rows (no ORM entities); Provider validates them by attribute
+_PROVIDERS = ProviderModel.__table__
+
 
 @router.get("/", response_model=List[Provider])
 def get_providers(
@@ -16,15 +20,14 @@ def get_providers(
     provider_type_sector: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    query = db.query(ProviderModel)
+    stmt = select(_PROVIDERS)
     
     if provider_region:
-        query = query.filter(ProviderModel.provider_region == provider_region)
+        stmt = stmt.where(ProviderModel.provider_region == provider_region)
     if provider_type_sector:
-        query = query.filter(ProviderModel.provider_type_sector == provider_type_sector)
+        stmt = stmt.where(ProviderModel.provider_type_sector == provider_type_sector)
     
-    providers = query.offset(skip).limit(limit).all()
-    return providers
+    return db.execute(stmt.offset(skip).limit(limit)).all()
 
 
 @router.get("/{provider_id}", response_model=Provider)
@@ -9,11 +9,31 @@ class Settings(BaseSettings):
     postgres_db: str
     postgres_host: str = "localhost"
     postgres_port: int = 5432
+    # Imports running at once (MAX_CONCURRENT_IMPORTS); extra requests queue behind them
+    max_concurrent_imports: int = 1
+    # Level for the import/conversion loggers (IMPORT_LOG_LEVEL); INFO brings back per-step progress lines
+    import_log_level: str = "WARNING"
+    # Run Base.metadata.create_all at startup (CREATE_TABLES_ON_STARTUP); turn off once
+    # the schema is managed by a one-off migration step so workers boot without DDL
+    create_tables_on_startup: bool = True
+    # Sync engine pool (DB_POOL_SIZE etc.) and the asyncpg engine's own pool
+    # (DB_ASYNC_POOL_SIZE etc.); both engines share the timeout, replace connections older
+    # than db_pool_recycle seconds and pre-ping the rest, so idle-dropped ones never reach a request
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_async_pool_size: int = 5
+    db_async_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 3600
     
     @property
     def database_url(self) -> str:
         return f"postgresql://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
     
+    @property
+    def async_database_url(self) -> str:
+        return f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+    
     class Config:
         env_file = ".env"
 
@@ -1,43 +1,78 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+import atexit
 import logging
+import logging.config
+import queue
 import sys
 from app.core.config import settings
 from app.core.database import get_db, engine, Base
 from app.api import locations, providers, brands, data_import, location_data_reconstruction, data_filtering
+from app.utils.log_handlers import BufferedFileHandler, DrainingQueueListener
 
-# Configure logging with better formatting
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('cqc_api.log', mode='a', encoding='utf-8')
-    ]
+# Console and file writes happen on a background listener thread; log calls on the
+# request path only format the record and put it on the queue. The log file is
+# written in 64 KB batches, flushed whenever the queue runs dry or on errors
+log_queue = queue.Queue(-1)
+log_listener = DrainingQueueListener(
+    log_queue,
+    logging.StreamHandler(sys.stdout),
+    BufferedFileHandler('cqc_api.log', mode='a', encoding='utf-8'),
+    respect_handler_level=True
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 
-# Set specific loggers to INFO level to ensure our import logs show up
-logging.getLogger('app.utils.parquet_converter').setLevel(logging.INFO)
-logging.getLogger('app.utils.data_import').setLevel(logging.INFO)
-logging.getLogger('app.api.data_import').setLevel(logging.INFO)
-
-# Also set uvicorn loggers to INFO to see server logs
-logging.getLogger('uvicorn.access').setLevel(logging.INFO)
-logging.getLogger('uvicorn.error').setLevel(logging.INFO)
+# Configure logging with better formatting, all in one dictConfig call
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {
+            "format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+            "datefmt": "%Y-%m-%d %H:%M:%S",
+        },
+    },
+    "handlers": {
+        "queue": {"class": "logging.handlers.QueueHandler", "queue": log_queue, "formatter": "default"},
+    },
+    "loggers": {
+        # Import loggers default to WARNING; set IMPORT_LOG_LEVEL=INFO to see per-step import logs
+        "app.utils.parquet_converter": {"level": settings.import_log_level.upper()},
+        "app.utils.data_import": {"level": settings.import_log_level.upper()},
+        "app.api.data_import": {"level": settings.import_log_level.upper()},
+        # Also set uvicorn loggers to INFO to see server logs
+        "uvicorn.access": {"level": "INFO"},
+        "uvicorn.error": {"level": "INFO"},
+    },
+    "root": {"level": "INFO", "handlers": ["queue"]},
+}
+logging.config.dictConfig(LOGGING)
 
 # Get the root logger to confirm setup
 logger = logging.getLogger(__name__)
 logger.info("🚀 CQC API starting with enhanced logging enabled")
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create tables on startup (off the event loop) and drain queued logs on shutdown"""
+    # Skipped when a separate migration step owns the schema
+    if settings.create_tables_on_startup:
+        await run_in_threadpool(Base.metadata.create_all, bind=engine)
+    yield
+    log_listener.stop()
+    atexit.unregister(log_listener.stop)
+
 
 app = FastAPI(
     title=settings.app_name,
     description="API for CQC Healthcare Data",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -76,7 +111,7 @@ async def test_logging():
     logger.warning("⚠️  This is a WARNING level message")
     logger.error("❌ This is an ERROR level message")
     
-    # Test import loggers specifically
+    # Test import loggers specifically; their INFO lines only appear when IMPORT_LOG_LEVEL allows them
     import_logger = logging.getLogger('app.utils.data_import')
     import_logger.info("🔄 Testing data import logger")
     
@@ -86,5 +121,9 @@ async def test_logging():
     return {
         "message": "Logging test completed",
         "check_console": "Look at your console/terminal where you started the server",
-        "check_file": "Also check cqc_api.log file in the project root"
+        "check_file": "Also check cqc_api.log file in the project root",
+        "import_loggers": (
+            f"Import loggers log at {settings.import_log_level.upper()} (IMPORT_LOG_LEVEL, default WARNING); "
+            "their INFO test lines only appear when it is set to INFO or DEBUG"
+        )
     }
\ No newline at end of file
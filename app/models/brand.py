@@ -10,4 +10,4 @@ class Brand(Base):
     brand_name = Column(String, nullable=False)
 
     # Relationships
-    provider_affiliations = relationship("ProviderBrand", back_populates="brand")
\ No newline at end of file
+    provider_affiliations = relationship("ProviderBrand", back_populates="brand", lazy="raise")
\ No newline at end of file
@@ -12,6 +12,7 @@ class DataPeriod(Base):
     month = Column(Integer, nullable=False)  # 1-12
     file_name = Column(String)
     created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now())  # bumped when an import into this period finishes
     
     # Ensure unique year/month combinations
     __table_args__ = (
@@ -19,10 +20,10 @@ class DataPeriod(Base):
     )
 
     # Relationships
-    location_data = relationship("LocationPeriodData", back_populates="data_period")
+    location_data = relationship("LocationPeriodData", back_populates="data_period", lazy="raise")
     # location_activity_flags relationship removed - table no longer used
-    location_regulated_activities = relationship("LocationRegulatedActivity", back_populates="data_period")
-    location_service_types = relationship("LocationServiceType", back_populates="data_period")
-    location_service_user_bands = relationship("LocationServiceUserBand", back_populates="data_period")
-    dual_registrations = relationship("DualRegistration", back_populates="data_period")
-    provider_brands = relationship("ProviderBrand", back_populates="data_period")
\ No newline at end of file
+    location_regulated_activities = relationship("LocationRegulatedActivity", back_populates="data_period", lazy="raise")
+    location_service_types = relationship("LocationServiceType", back_populates="data_period", lazy="raise")
+    location_service_user_bands = relationship("LocationServiceUserBand", back_populates="data_period", lazy="raise")
+    dual_registrations = relationship("DualRegistration", back_populates="data_period", lazy="raise")
+    provider_brands = relationship("ProviderBrand", back_populates="data_period", lazy="raise")
\ No newline at end of file
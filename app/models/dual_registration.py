@@ -17,9 +17,9 @@ class DualRegistration(Base):
     is_primary = Column(Boolean, default=False)
     
     # Relationships to Location model
-    location = relationship("Location", foreign_keys=[location_id], back_populates="dual_registrations_as_location")
-    linked_organisation = relationship("Location", foreign_keys=[linked_organisation_id], back_populates="dual_registrations_as_linked_org")
-    data_period = relationship("DataPeriod", back_populates="dual_registrations")
+    location = relationship("Location", foreign_keys=[location_id], back_populates="dual_registrations_as_location", lazy="raise")
+    linked_organisation = relationship("Location", foreign_keys=[linked_organisation_id], back_populates="dual_registrations_as_linked_org", lazy="raise")
+    data_period = relationship("DataPeriod", back_populates="dual_registrations", lazy="raise")
 
     def __repr__(self):
         return f"<DualRegistration(location_id='{self.location_id}', linked_org='{self.linked_organisation_id}', period_id='{self.period_id}')>"
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Date, DECIMAL, ForeignKey
+from sqlalchemy import Column, String, Date, DECIMAL, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -39,14 +39,27 @@ class Location(Base):
     location_longitude = Column(DECIMAL)
     location_parliamentary_constituency = Column(String)
 
-    # Relationships
-    provider = relationship("Provider", back_populates="locations")
-    period_data = relationship("LocationPeriodData", back_populates="location")
+    # GiST index on the (longitude, latitude) point so nearby searches are an index
+    # range lookup on both axes; built-in Postgres geometry, no PostGIS required
+    __table_args__ = (
+        Index(
+            "ix_locations_point",
+            func.point(location_longitude, location_latitude),
+            postgresql_using="gist",
+        ),
+        # Geography filters of the locations list (region, or region + local authority)
+        Index("ix_locations_region_la", location_region, location_local_authority),
+    )
+
+    # Relationships: lazy="raise" everywhere, so an implicit per-row load fails loudly;
+    # queries that need related rows opt in with selectinload()/joinedload()
+    provider = relationship("Provider", back_populates="locations", lazy="raise")
+    period_data = relationship("LocationPeriodData", back_populates="location", lazy="raise")
     # activity_flags relationship removed - table no longer used
-    regulated_activities = relationship("LocationRegulatedActivity", back_populates="location")
-    service_types = relationship("LocationServiceType", back_populates="location")
-    service_user_bands = relationship("LocationServiceUserBand", back_populates="location")
+    regulated_activities = relationship("LocationRegulatedActivity", back_populates="location", lazy="raise")
+    service_types = relationship("LocationServiceType", back_populates="location", lazy="raise")
+    service_user_bands = relationship("LocationServiceUserBand", back_populates="location", lazy="raise")
     
     # Dual registration relationships
-    dual_registrations_as_location = relationship("DualRegistration", foreign_keys="DualRegistration.location_id", back_populates="location")
-    dual_registrations_as_linked_org = relationship("DualRegistration", foreign_keys="DualRegistration.linked_organisation_id", back_populates="linked_organisation")
\ No newline at end of file
+    dual_registrations_as_location = relationship("DualRegistration", foreign_keys="DualRegistration.location_id", back_populates="location", lazy="raise")
+    dual_registrations_as_linked_org = relationship("DualRegistration", foreign_keys="DualRegistration.linked_organisation_id", back_populates="linked_organisation", lazy="raise")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Date, Integer, BigInteger, ForeignKey, Boolean, UniqueConstraint, DECIMAL
+from sqlalchemy import Column, String, Date, Integer, BigInteger, ForeignKey, Boolean, UniqueConstraint, DECIMAL, Index
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -27,8 +27,12 @@ class LocationPeriodData(Base):
     # Ensure unique location per period
     __table_args__ = (
         UniqueConstraint('location_id', 'period_id', name='uq_location_period'),
+        # Period filters (care home / rating) answered by an index-only scan that also
+        # yields location_id for the join; uq_location_period leads with location_id
+        Index('ix_lpd_period_care', 'period_id', 'is_care_home',
+              postgresql_include=['location_id', 'latest_overall_rating']),
     )
 
     # Relationships
-    location = relationship("Location", back_populates="period_data")
-    data_period = relationship("DataPeriod", back_populates="location_data")
\ No newline at end of file
+    location = relationship("Location", back_populates="period_data", lazy="raise")
+    data_period = relationship("DataPeriod", back_populates="location_data", lazy="raise")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Date, DECIMAL, ForeignKey
+from sqlalchemy import Column, String, Date, DECIMAL, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -35,6 +35,11 @@ class Provider(Base):
     provider_main_partner_name = Column(String)
     provider_main_partner_name_raw = Column(String)  # Raw value including * and - symbols
 
+    # Filters of the providers list (region, or region + type/sector)
+    __table_args__ = (
+        Index("ix_providers_region_sector", provider_region, provider_type_sector),
+    )
+
     # Relationships
-    brand_affiliations = relationship("ProviderBrand", back_populates="provider")
-    locations = relationship("Location", back_populates="provider")
\ No newline at end of file
+    brand_affiliations = relationship("ProviderBrand", back_populates="provider", lazy="raise")
+    locations = relationship("Location", back_populates="provider", lazy="raise")
\ No newline at end of file
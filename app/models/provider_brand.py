@@ -11,6 +11,6 @@ class ProviderBrand(Base):
     period_id = Column(BigInteger, ForeignKey("data_periods.period_id"), primary_key=True)
 
     # Relationships
-    provider = relationship("Provider", back_populates="brand_affiliations")
-    brand = relationship("Brand", back_populates="provider_affiliations")
-    data_period = relationship("DataPeriod", back_populates="provider_brands")
\ No newline at end of file
+    provider = relationship("Provider", back_populates="brand_affiliations", lazy="raise")
+    brand = relationship("Brand", back_populates="provider_affiliations", lazy="raise")
+    data_period = relationship("DataPeriod", back_populates="provider_brands", lazy="raise")
\ No newline at end of file
@@ -10,7 +10,7 @@ class RegulatedActivity(Base):
     activity_name = Column(String, unique=True, nullable=False)
 
     # Relationships
-    locations = relationship("LocationRegulatedActivity", back_populates="activity")
+    locations = relationship("LocationRegulatedActivity", back_populates="activity", lazy="raise")
 
 
 class LocationRegulatedActivity(Base):
@@ -21,6 +21,6 @@ class LocationRegulatedActivity(Base):
     period_id = Column(BigInteger, ForeignKey("data_periods.period_id"), primary_key=True)
 
     # Relationships
-    location = relationship("Location", back_populates="regulated_activities")
-    activity = relationship("RegulatedActivity", back_populates="locations")
-    data_period = relationship("DataPeriod", back_populates="location_regulated_activities")
\ No newline at end of file
+    location = relationship("Location", back_populates="regulated_activities", lazy="raise")
+    activity = relationship("RegulatedActivity", back_populates="locations", lazy="raise")
+    data_period = relationship("DataPeriod", back_populates="location_regulated_activities", lazy="raise")
\ No newline at end of file
@@ -10,7 +10,7 @@ class ServiceType(Base):
     service_type_name = Column(String, unique=True, nullable=False)
 
     # Relationships
-    locations = relationship("LocationServiceType", back_populates="service_type")
+    locations = relationship("LocationServiceType", back_populates="service_type", lazy="raise")
 
 
 class LocationServiceType(Base):
@@ -21,6 +21,6 @@ class LocationServiceType(Base):
     period_id = Column(BigInteger, ForeignKey("data_periods.period_id"), primary_key=True)
 
     # Relationships
-    location = relationship("Location", back_populates="service_types")
-    service_type = relationship("ServiceType", back_populates="locations")
-    data_period = relationship("DataPeriod", back_populates="location_service_types")
\ No newline at end of file
+    location = relationship("Location", back_populates="service_types", lazy="raise")
+    service_type = relationship("ServiceType", back_populates="locations", lazy="raise")
+    data_period = relationship("DataPeriod", back_populates="location_service_types", lazy="raise")
\ No newline at end of file
@@ -10,7 +10,7 @@ class ServiceUserBand(Base):
     band_name = Column(String, unique=True, nullable=False)
 
     # Relationships
-    locations = relationship("LocationServiceUserBand", back_populates="band")
+    locations = relationship("LocationServiceUserBand", back_populates="band", lazy="raise")
 
 
 class LocationServiceUserBand(Base):
@@ -21,6 +21,6 @@ class LocationServiceUserBand(Base):
     period_id = Column(BigInteger, ForeignKey("data_periods.period_id"), primary_key=True)
 
     # Relationships
-    location = relationship("Location", back_populates="service_user_bands")
-    band = relationship("ServiceUserBand", back_populates="locations")
-    data_period = relationship("DataPeriod", back_populates="location_service_user_bands")
\ No newline at end of file
+    location = relationship("Location", back_populates="service_user_bands", lazy="raise")
+    band = relationship("ServiceUserBand", back_populates="locations", lazy="raise")
+    data_period = relationship("DataPeriod", back_populates="location_service_user_bands", lazy="raise")
\ No newline at end of file
@@ -1,8 +1,15 @@
 import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from pathlib import Path
+from sqlalchemy import event, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.models.brand import Brand
@@ -16,9 +23,78 @@ from app.models.data_period import DataPeriod
 # LocationActivityFlags import removed - table no longer used
 from app.models.dual_registration import DualRegistration
 from app.models.provider_brand import ProviderBrand
+from app.utils.parquet_converter import read_parquet_metadata
 
 logger = logging.getLogger(__name__)
 
+# Rows per Parquet record batch during import; bounds memory regardless of file size
+PARQUET_BATCH_SIZE = 65536
+
+# Rows per set-based insert when importing an already loaded Excel sheet
+EXCEL_BATCH_SIZE = 5000
+
+# Pre-buffer column chunks: the reader coalesces each row group's column chunks into
+# a few large reads instead of one small read per page. Default on recent pyarrow,
+# off on older releases, so it is set explicitly (requirements leave pyarrow unpinned)
+PARQUET_FORMAT = ds.ParquetFileFormat(
+    default_fragment_scan_options=ds.ParquetFragmentScanOptions(pre_buffer=True)
+)
+
+# Static main-sheet columns the importer maps onto the schema. The dynamic
+# "Regulated activity - / Service type - / Service user band - " columns are added
+# per file from the lookup scan; every other column is skipped at read time.
+MAIN_COLUMNS = (
+    "Location ID", "Location Name", "Location HSCA start date", "Location ODS Code",
+    "Location Telephone Number", "Location Web Address", "Location Type/Sector",
+    "Location Inspection Directorate", "Location Primary Inspection Category",
+    "Location Region", "Location NHS Region", "Location Local Authority",
+    "Location ONSPD CCG Code", "Location ONSPD CCG",
+    "Location Commissioning CCG Code", "Location Commissioning CCG",
+    "Location Street Address", "Location Address Line 2", "Location City", "Location County",
+    "Location Postal Code", "Location PAF ID", "Location UPRN ID",
+    "Location Latitude", "Location Longitude", "Location Parliamentary Constituency",
+    "Dormant (Y/N)", "Care home?", "Registered manager", "Care homes beds",
+    "Location Latest Overall Rating", "Publication Date", "Inherited Rating (Y/N)",
+    "Provider ID", "Provider Name", "Provider HSCA start date", "Provider Companies House Number",
+    "Provider Charity Number", "Provider Type/Sector", "Provider Inspection Directorate",
+    "Provider Primary Inspection Category", "Provider Ownership Type",
+    "Provider Telephone Number", "Provider Web Address", "Provider Street Address",
+    "Provider Address Line 2", "Provider City", "Provider County", "Provider Postal Code",
+    "Provider PAF ID", "Provider UPRN ID", "Provider Local Authority", "Provider Region",
+    "Provider NHS Region", "Provider Latitude", "Provider Longitude",
+    "Provider Parliamentary Constituency", "Provider Nominated Individual Name",
+    "Provider Main Partner Name", "Brand ID", "Brand Name",
+)
+
+# Dual registration sheet columns used to build the dual lookup
+DUAL_COLUMNS = ("Location ID", "Linked Organisation ID", "Relationship", "Relationship Start Date", "Primary ID")
+
+# Batches at least this large are streamed with COPY into a staging table and merged
+# with INSERT ... SELECT ... ON CONFLICT DO NOTHING; smaller ones use a multi-row INSERT
+COPY_MIN_ROWS = 100
+# COPY text format: \N is NULL, and backslashes, tabs and line breaks inside values
+# are escaped, so a literal "\N" or empty string loads exactly as the INSERT path stores it
+COPY_NULL = "\\N"
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+# Per-transaction PostgreSQL settings for bulk loads. With synchronous_commit off a
+# server crash can lose the last few batch commits, but never corrupts data, and
+# re-running an import is idempotent.
+BULK_LOAD_SETTINGS = {"synchronous_commit": "off", "work_mem": "256MB"}
+
+# Tables written by an import; re-analyzed afterwards so the planner sees the new rows
+BULK_LOADED_TABLES = (
+    "brands", "providers", "provider_brands", "locations", "location_period_data",
+    "location_regulated_activities", "location_service_types", "location_service_user_bands",
+    "dual_registrations",
+)
+
+
+def _apply_bulk_load_settings(session, transaction, connection):
+    """Session after_begin hook: SET LOCAL only lasts one transaction, so reapply on each"""
+    for name, value in BULK_LOAD_SETTINGS.items():
+        connection.exec_driver_sql(f"SET LOCAL {name} = '{value}'")
+
 
 class CQCDataImporter:
     def __init__(self, db: Session):
@@ -34,6 +110,8 @@ class CQCDataImporter:
             "periods_created": 0,
             "errors": []
         }
+        self._seen_providers = set()
+        self._seen_locations = set()
 
     def clean_value(self, value) -> Optional[str]:
         """Clean and validate string values - preserve asterisk (*) in text fields"""
@@ -493,7 +571,53 @@ class CQCDataImporter:
                 ).first()
         return period
 
+    def _touch_data_period(self, year: Optional[int], month: Optional[int]):
+        """Bump updated_at for a period once an import into it ends, so data versions change on re-imports"""
+        if year is None or month is None:
+            return
+        try:
+            # Own transaction: the import's session may be mid-transaction or failed here
+            with self.db.get_bind().begin() as connection:
+                connection.execute(
+                    update(DataPeriod)
+                    .where(DataPeriod.year == year, DataPeriod.month == month)
+                    .values(updated_at=func.now())
+                )
+        except Exception as e:
+            logger.warning(f"Could not update data period {year}-{month:02d}: {str(e)}")
 
+    def _provider_values(self, row, provider_id: str) -> Dict:
+        """Column values for a new Provider row"""
+        return {
+            "provider_id": provider_id,
+            "provider_name": self.parse_string_field(row.get('Provider Name'), preserve_special=False) or f"Provider {provider_id}",
+            "provider_hsca_start_date": self.parse_date(row.get('Provider HSCA start date')),
+            "provider_companies_house_number": self.parse_string_field(row.get('Provider Companies House Number'), preserve_special=True),
+            "provider_charity_number": self.parse_string_field(row.get('Provider Charity Number'), preserve_special=True),
+            "provider_type_sector": self.parse_string_field(row.get('Provider Type/Sector'), preserve_special=True),
+            "provider_inspection_directorate": self.parse_string_field(row.get('Provider Inspection Directorate'), preserve_special=True),
+            "provider_primary_inspection_category": self.clean_value(row.get('Provider Primary Inspection Category')),
+            "provider_ownership_type": self.parse_string_field(row.get('Provider Ownership Type'), preserve_special=True),
+            "provider_telephone_number": self.parse_telephone(row.get('Provider Telephone Number')),
+            "provider_web_address": self.parse_string_field(row.get('Provider Web Address'), preserve_special=True),
+            "provider_street_address": self.parse_string_field(row.get('Provider Street Address'), preserve_special=True),
+            "provider_address_line_2": self.parse_string_field(row.get('Provider Address Line 2'), preserve_special=True),
+            "provider_city": self.parse_string_field(row.get('Provider City'), preserve_special=True),
+            "provider_county": self.parse_string_field(row.get('Provider County'), preserve_special=True),
+            "provider_postal_code": self.parse_categorical_numeric(row.get('Provider Postal Code')),
+            "provider_paf_id": self.parse_categorical_numeric(row.get('Provider PAF ID')),
+            "provider_uprn_id": self.parse_categorical_numeric(row.get('Provider UPRN ID')),
+            "provider_local_authority": self.parse_string_field(row.get('Provider Local Authority'), preserve_special=True),
+            "provider_region": self.parse_string_field(row.get('Provider Region'), preserve_special=True),
+            "provider_nhs_region": self.parse_string_field(row.get('Provider NHS Region'), preserve_special=True),
+            "provider_latitude": self.parse_decimal_field(row.get('Provider Latitude')),
+            "provider_longitude": self.parse_decimal_field(row.get('Provider Longitude')),
+            "provider_parliamentary_constituency": self.parse_string_field(row.get('Provider Parliamentary Constituency'), preserve_special=True),
+            "provider_nominated_individual_name": self.parse_string_with_raw(row.get('Provider Nominated Individual Name'))[0],
+            "provider_nominated_individual_name_raw": self.parse_string_with_raw(row.get('Provider Nominated Individual Name'))[1],
+            "provider_main_partner_name": self.parse_string_with_raw(row.get('Provider Main Partner Name'))[0],
+            "provider_main_partner_name_raw": self.parse_string_with_raw(row.get('Provider Main Partner Name'))[1]
+        }
 
     def get_or_create_provider_by_original_id(self, row: pd.Series) -> Optional[Provider]:
         """Get existing provider by original ID or create new one with auto-increment ID"""
@@ -509,36 +633,7 @@ class CQCDataImporter:
             return existing_provider
 
 
-        provider = Provider(
-            provider_id=provider_id,
-            provider_name=self.parse_string_field(row.get('Provider Name'), preserve_special=False) or f"Provider {provider_id}",
-            provider_hsca_start_date=self.parse_date(row.get('Provider HSCA start date')),
-            provider_companies_house_number=self.parse_string_field(row.get('Provider Companies House Number'), preserve_special=True),
-            provider_charity_number=self.parse_string_field(row.get('Provider Charity Number'), preserve_special=True),
-            provider_type_sector=self.parse_string_field(row.get('Provider Type/Sector'), preserve_special=True),
-            provider_inspection_directorate=self.parse_string_field(row.get('Provider Inspection Directorate'), preserve_special=True),
-            provider_primary_inspection_category=self.clean_value(row.get('Provider Primary Inspection Category')),
-            provider_ownership_type=self.parse_string_field(row.get('Provider Ownership Type'), preserve_special=True),
-            provider_telephone_number=self.parse_telephone(row.get('Provider Telephone Number')),
-            provider_web_address=self.parse_string_field(row.get('Provider Web Address'), preserve_special=True),
-            provider_street_address=self.parse_string_field(row.get('Provider Street Address'), preserve_special=True),
-            provider_address_line_2=self.parse_string_field(row.get('Provider Address Line 2'), preserve_special=True),
-            provider_city=self.parse_string_field(row.get('Provider City'), preserve_special=True),
-            provider_county=self.parse_string_field(row.get('Provider County'), preserve_special=True),
-            provider_postal_code=self.parse_categorical_numeric(row.get('Provider Postal Code')),
-            provider_paf_id=self.parse_categorical_numeric(row.get('Provider PAF ID')),
-            provider_uprn_id=self.parse_categorical_numeric(row.get('Provider UPRN ID')),
-            provider_local_authority=self.parse_string_field(row.get('Provider Local Authority'), preserve_special=True),
-            provider_region=self.parse_string_field(row.get('Provider Region'), preserve_special=True),
-            provider_nhs_region=self.parse_string_field(row.get('Provider NHS Region'), preserve_special=True),
-            provider_latitude=self.parse_decimal_field(row.get('Provider Latitude')),
-            provider_longitude=self.parse_decimal_field(row.get('Provider Longitude')),
-            provider_parliamentary_constituency=self.parse_string_field(row.get('Provider Parliamentary Constituency'), preserve_special=True),
-            provider_nominated_individual_name=self.parse_string_with_raw(row.get('Provider Nominated Individual Name'))[0],
-            provider_nominated_individual_name_raw=self.parse_string_with_raw(row.get('Provider Nominated Individual Name'))[1],
-            provider_main_partner_name=self.parse_string_with_raw(row.get('Provider Main Partner Name'))[0],
-            provider_main_partner_name_raw=self.parse_string_with_raw(row.get('Provider Main Partner Name'))[1]
-        )
+        provider = Provider(**self._provider_values(row, provider_id))
 
         try:
             self.db.add(provider)
@@ -551,6 +646,38 @@ class CQCDataImporter:
             self.stats["errors"].append(f"Provider {provider_id}: {str(e)}")
             return self.db.query(Provider).filter(Provider.provider_id == provider_id).first()
 
+    def _location_values(self, row, location_id: str, provider_id: str) -> Dict:
+        """Column values for a new Location row (static data only)"""
+        return {
+            "location_id": location_id,
+            "provider_id": provider_id,
+            "location_name": self.parse_string_field(row.get('Location Name'), preserve_special=False) or f"Location {location_id}",
+            "location_hsca_start_date": self.parse_date(row.get('Location HSCA start date')),
+            "location_ods_code": self.parse_categorical_numeric(row.get('Location ODS Code')),
+            "location_telephone_number": self.parse_telephone(row.get('Location Telephone Number')),
+            "location_web_address": self.parse_string_field(row.get('Location Web Address'), preserve_special=True),
+            "location_type_sector": self.parse_string_field(row.get('Location Type/Sector'), preserve_special=True),
+            "location_inspection_directorate": self.parse_string_field(row.get('Location Inspection Directorate'), preserve_special=True),
+            "location_primary_inspection_category": self.parse_string_field(row.get('Location Primary Inspection Category'), preserve_special=True),
+            "location_region": self.parse_string_field(row.get('Location Region'), preserve_special=True),
+            "location_nhs_region": self.parse_string_field(row.get('Location NHS Region'), preserve_special=True),
+            "location_local_authority": self.parse_string_field(row.get('Location Local Authority'), preserve_special=True),
+            "location_onspd_ccg_code": self.parse_categorical_numeric(row.get('Location ONSPD CCG Code')),
+            "location_onspd_ccg": self.clean_value(row.get('Location ONSPD CCG')),
+            "location_commissioning_ccg_code": self.parse_categorical_numeric(row.get('Location Commissioning CCG Code')),
+            "location_commissioning_ccg": self.clean_value(row.get('Location Commissioning CCG')),
+            "location_street_address": self.clean_value(row.get('Location Street Address')),
+            "location_address_line_2": self.parse_string_field(row.get('Location Address Line 2'), preserve_special=True),
+            "location_city": self.parse_string_field(row.get('Location City'), preserve_special=True),
+            "location_county": self.parse_string_field(row.get('Location County'), preserve_special=True),
+            "location_postal_code": self.parse_categorical_numeric(row.get('Location Postal Code')),
+            "location_paf_id": self.parse_categorical_numeric(row.get('Location PAF ID')),
+            "location_uprn_id": self.parse_categorical_numeric(row.get('Location UPRN ID')),
+            "location_latitude": self.parse_decimal_field(row.get('Location Latitude')),
+            "location_longitude": self.parse_decimal_field(row.get('Location Longitude')),
+            "location_parliamentary_constituency": self.parse_string_field(row.get('Location Parliamentary Constituency'), preserve_special=True)
+        }
+
     def get_or_create_location_by_original_id(self, row: pd.Series, provider: Provider) -> Optional[Location]:
         """Get existing location by original ID or create new one (static data only)"""
         location_id = self.parse_primary_key(row.get('Location ID'), 'Location ID')
@@ -565,35 +692,7 @@ class CQCDataImporter:
             return existing_location
 
         # Create new location with static data only
-        location = Location(
-            location_id=location_id,
-            provider_id=provider.provider_id,
-            location_name=self.parse_string_field(row.get('Location Name'), preserve_special=False) or f"Location {location_id}",
-            location_hsca_start_date=self.parse_date(row.get('Location HSCA start date')),
-            location_ods_code=self.parse_categorical_numeric(row.get('Location ODS Code')),
-            location_telephone_number=self.parse_telephone(row.get('Location Telephone Number')),
-            location_web_address=self.parse_string_field(row.get('Location Web Address'), preserve_special=True),
-            location_type_sector=self.parse_string_field(row.get('Location Type/Sector'), preserve_special=True),
-            location_inspection_directorate=self.parse_string_field(row.get('Location Inspection Directorate'), preserve_special=True),
-            location_primary_inspection_category=self.parse_string_field(row.get('Location Primary Inspection Category'), preserve_special=True),
-            location_region=self.parse_string_field(row.get('Location Region'), preserve_special=True),
-            location_nhs_region=self.parse_string_field(row.get('Location NHS Region'), preserve_special=True),
-            location_local_authority=self.parse_string_field(row.get('Location Local Authority'), preserve_special=True),
-            location_onspd_ccg_code=self.parse_categorical_numeric(row.get('Location ONSPD CCG Code')),
-            location_onspd_ccg=self.clean_value(row.get('Location ONSPD CCG')),
-            location_commissioning_ccg_code=self.parse_categorical_numeric(row.get('Location Commissioning CCG Code')),
-            location_commissioning_ccg=self.clean_value(row.get('Location Commissioning CCG')),
-            location_street_address=self.clean_value(row.get('Location Street Address')),
-            location_address_line_2=self.parse_string_field(row.get('Location Address Line 2'), preserve_special=True),
-            location_city=self.parse_string_field(row.get('Location City'), preserve_special=True),
-            location_county=self.parse_string_field(row.get('Location County'), preserve_special=True),
-            location_postal_code=self.parse_categorical_numeric(row.get('Location Postal Code')),
-            location_paf_id=self.parse_categorical_numeric(row.get('Location PAF ID')),
-            location_uprn_id=self.parse_categorical_numeric(row.get('Location UPRN ID')),
-            location_latitude=self.parse_decimal_field(row.get('Location Latitude')),
-            location_longitude=self.parse_decimal_field(row.get('Location Longitude')),
-            location_parliamentary_constituency=self.parse_string_field(row.get('Location Parliamentary Constituency'), preserve_special=True)
-        )
+        location = Location(**self._location_values(row, location_id, provider.provider_id))
 
         try:
             self.db.add(location)
@@ -606,6 +705,21 @@ class CQCDataImporter:
             self.stats["errors"].append(f"Location {location_id}: {str(e)}")
             return self.db.query(Location).filter(Location.location_id == location_id).first()
 
+    def _location_period_values(self, row, location_id: str, period_id: int) -> Dict:
+        """Column values for a new LocationPeriodData row"""
+        return {
+            "location_id": location_id,
+            "period_id": period_id,
+            "is_dormant": self.parse_boolean_field(row.get('Dormant (Y/N)')),
+            "is_care_home": self.parse_boolean_field(row.get('Care home?')),
+            "registered_manager": self.parse_string_with_raw(row.get('Registered manager'))[0],
+            "registered_manager_raw": self.parse_string_with_raw(row.get('Registered manager'))[1],
+            "care_homes_beds": self.parse_numeric_field(row.get('Care homes beds')),
+            "latest_overall_rating": self.parse_string_field(row.get('Location Latest Overall Rating'), preserve_special=True),
+            "publication_date": self.validate_date(self.parse_date(row.get('Publication Date')), 'publication_date'),
+            "is_inherited_rating": self.parse_boolean_field(row.get('Inherited Rating (Y/N)'))
+        }
+
     def create_location_period_data(self, location: Location, row: pd.Series, data_period: DataPeriod) -> Optional[LocationPeriodData]:
         """Create time-varying data for a location in a specific period"""
         # Check if period data already exists
@@ -618,18 +732,7 @@ class CQCDataImporter:
             return existing_period_data
         
         # Create new period data
-        period_data = LocationPeriodData(
-            location_id=location.location_id,
-            period_id=data_period.period_id,
-            is_dormant=self.parse_boolean_field(row.get('Dormant (Y/N)')),
-            is_care_home=self.parse_boolean_field(row.get('Care home?')),
-            registered_manager=self.parse_string_with_raw(row.get('Registered manager'))[0],
-            registered_manager_raw=self.parse_string_with_raw(row.get('Registered manager'))[1],
-            care_homes_beds=self.parse_numeric_field(row.get('Care homes beds')),
-            latest_overall_rating=self.parse_string_field(row.get('Location Latest Overall Rating'), preserve_special=True),
-            publication_date=self.validate_date(self.parse_date(row.get('Publication Date')), 'publication_date'),
-            is_inherited_rating=self.parse_boolean_field(row.get('Inherited Rating (Y/N)'))
-        )
+        period_data = LocationPeriodData(**self._location_period_values(row, location.location_id, data_period.period_id))
         
         try:
             self.db.add(period_data)
@@ -710,7 +813,7 @@ class CQCDataImporter:
             logger.info(f"Loaded {len(df)} records from Excel")
             
             # Scan headers and populate lookup tables dynamically
-            lookup_mappings = self.scan_and_populate_lookup_tables(df)
+            lookup_mappings = self.scan_and_populate_lookup_tables(df.columns)
             
             # Filter for care homes if requested
             if filter_care_homes is not None:
@@ -721,49 +824,19 @@ class CQCDataImporter:
                     df = df[df['Care home?'] != 'Y']
                     logger.info(f"Filtered to {len(df)} non-care home records")
             
-            # Process each row
-            for index, row in df.iterrows():
+            # Process rows in set-based batches (one commit each) like the Parquet path
+            total_records = len(df)
+            for batch_start in range(0, total_records, EXCEL_BATCH_SIZE):
+                df_batch = df.iloc[batch_start:batch_start + EXCEL_BATCH_SIZE]
+                batch_end = batch_start + len(df_batch)
                 try:
-                    # Create provider first
-                    provider = self.get_or_create_provider_by_original_id(row)
-                    if not provider:
-                        continue
-                    
-                    # Create provider-brand relationship for this period
-                    brand_id = self.parse_primary_key(row.get('Brand ID'), 'Brand ID')
-                    brand_name = self.parse_string_field(row.get('Brand Name'), preserve_special=False)
-                    brand = None
-                    if brand_id and brand_id != '-':
-                        brand = self.get_or_create_brand(brand_id, brand_name)
-                    self.create_provider_brand_relationship(provider, brand, data_period)
-                    
-                    # Get or create location (static data)
-                    location = self.get_or_create_location_by_original_id(row, provider)
-                    if not location:
-                        continue
-                    
-                    # Create time-varying period data
-                    period_data = self.create_location_period_data(location, row, data_period)
-                    if not period_data:
-                        continue
-                    
-                    # Note: LocationActivityFlags table no longer used - data now in association tables
-                    
-                    # Create dynamic associations based on discovered columns
-                    self.create_dynamic_associations(location, row, data_period, lookup_mappings)
-                    
-                    # Commit the relationships
-                    self.db.commit()
-                    
-                    if (index + 1) % 100 == 0:
-                        logger.info(f"Processed {index + 1} records")
-                        
+                    self._bulk_import_batch(df_batch, data_period, lookup_mappings)
                 except Exception as e:
+                    # Fall back to row-by-row so one bad row does not sink the whole batch
                     self.db.rollback()
-                    error_msg = f"Row {index}: {str(e)}"
-                    self.stats["errors"].append(error_msg)
-                    logger.error(error_msg)
-                    continue
+                    logger.warning(f"Bulk insert failed for records {batch_start + 1}-{batch_end}, retrying row by row: {str(e)}")
+                    self._import_rows(df_batch, data_period, lookup_mappings, batch_start, total_records)
+                logger.info(f"Processed {batch_end} records")
             
             # Process dual registrations from third sheet if it exists (independent of main sheet columns)
             logger.info("Processing dual registrations from third sheet (if available)...")
@@ -781,6 +854,8 @@ class CQCDataImporter:
             logger.error(f"Import failed: {str(e)}")
             self.stats["errors"].append(f"Import failed: {str(e)}")
             return self.stats
+        finally:
+            self._touch_data_period(year, month)
 
     def process_dual_registrations(self, excel_path: str, data_period: DataPeriod):
         """Process dual registrations from third sheet if available"""
@@ -845,6 +920,9 @@ class CQCDataImporter:
             
             # Process each row in the dual registration sheet
             dual_pairs_processed = 0
+            # Per-row messages are only formatted when their level is enabled
+            log_rows = logger.isEnabledFor(logging.DEBUG)
+            log_pairs = logger.isEnabledFor(logging.INFO)
             for index, row in df_dual.iterrows():
                 try:
                     # Extract dual registration data from the sheet
@@ -854,16 +932,19 @@ class CQCDataImporter:
                     relationship_start_date = self.parse_date(row.get('Relationship Start Date'))
                     primary_id = self.clean_value(row.get('Primary ID'))
                     
-                    logger.debug(f"Row {index}: Location ID='{location_id}', Linked Org ID='{linked_organisation_id}', Relationship='{relationship_type}'")
+                    if log_rows:
+                        logger.debug(f"Row {index}: Location ID='{location_id}', Linked Org ID='{linked_organisation_id}', Relationship='{relationship_type}'")
                     
                     # We need both Location ID and Linked Organisation ID for dual registration
                     if not location_id or not linked_organisation_id:
-                        logger.debug(f"Row {index}: Missing required IDs - Location ID: {location_id}, Linked Org ID: {linked_organisation_id}")
+                        if log_rows:
+                            logger.debug(f"Row {index}: Missing required IDs - Location ID: {location_id}, Linked Org ID: {linked_organisation_id}")
                         continue
                     
                     # Skip if they're the same (not a dual registration)
                     if location_id == linked_organisation_id:
-                        logger.debug(f"Row {index}: Location ID and Linked Org ID are the same, skipping")
+                        if log_rows:
+                            logger.debug(f"Row {index}: Location ID and Linked Org ID are the same, skipping")
                         continue
                     
                     # Verify both locations exist
@@ -916,8 +997,9 @@ class CQCDataImporter:
                         self.db.commit()
                         dual_pairs_processed += 1
                         
-                        logger.info(f"✓ Created dual registrations ({relationship_type}): '{location1.location_name}' ({location1.location_id}) <-> '{location2.location_name}' ({location2.location_id}) for {data_period.year}-{data_period.month:02d}")
-                    else:
+                        if log_pairs:
+                            logger.info(f"✓ Created dual registrations ({relationship_type}): '{location1.location_name}' ({location1.location_id}) <-> '{location2.location_name}' ({location2.location_id}) for {data_period.year}-{data_period.month:02d}")
+                    elif log_rows:
                         if not location1:
                             logger.debug(f"Could not find location with original ID: {location_id}")
                         if not location2:
@@ -935,7 +1017,23 @@ class CQCDataImporter:
             # This is informational - dual registrations are optional
             self.stats["dual_registrations_processed"] = 0
 
-    def import_from_parquet(self, main_parquet_path: str, dual_parquet_path: str, filter_care_homes: bool = None, year: int = None, month: int = None) -> Dict:
+    @staticmethod
+    def care_home_filter(filter_care_homes: Optional[bool]) -> Optional[ds.Expression]:
+        """
+        Build the Parquet scan predicate for the care home filter.
+        
+        Mirrors the pandas semantics used for Excel imports: True keeps rows with
+        'Care home?' == 'Y'; False keeps everything else, including blanks.
+        """
+        if filter_care_homes is None:
+            return None
+        care_home = pc.field('Care home?')
+        if filter_care_homes:
+            return care_home == 'Y'
+        return (care_home != 'Y') | care_home.is_null()
+
+    def import_from_parquet(self, main_parquet_path: str, dual_parquet_path: str, filter_care_homes: bool = None, year: int = None, month: int = None,
+                            progress_callback: Optional[Callable[[int, int, Dict], None]] = None) -> Dict:
         """
         Optimized import from Parquet files with dual registration lookup
         
@@ -945,10 +1043,12 @@ class CQCDataImporter:
             filter_care_homes: Filter for care homes
             year: Data year
             month: Data month
+            progress_callback: Called after each record batch with (records done, total records, stats so far)
             
         Returns:
             Import statistics
         """
+        self._enable_bulk_load()
         try:
             import time
             start_time = time.time()
@@ -968,24 +1068,34 @@ class CQCDataImporter:
             data_period = self.get_or_create_data_period(year, month, file_name)
             logger.info(f"✅ Data period established: {year}-{month:02d} (ID: {data_period.period_id})")
             
+            # The dual registration file is independent of the main file: read it on a
+            # worker thread (pyarrow releases the GIL while decoding) so it overlaps
+            # the main-file metadata and lookup table setup below
+            dual_reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dual-parquet")
+            dual_future = dual_reader.submit(self._read_dual_parquet, dual_parquet_path)
+            dual_reader.shutdown(wait=False)
+            
             # Load main data Parquet file
             logger.info("📖 Step 1: Loading main data from Parquet file...")
             main_file_size = Path(main_parquet_path).stat().st_size / (1024 * 1024)
             logger.info(f"📁 Main Parquet file size: {main_file_size:.1f} MB")
             
-            df_main = pd.read_parquet(main_parquet_path)
-            logger.info(f"✅ Loaded {len(df_main)} records from main Parquet file")
-            logger.info(f"📋 Columns available: {len(df_main.columns)} columns")
+            # Stream the main file in record batches instead of materialising the whole table;
+            # the footer was usually parsed (and cached) already when the files were validated
+            main_metadata = read_parquet_metadata(main_parquet_path)
+            main_columns = main_metadata.schema.to_arrow_schema().names
+            logger.info(f"✅ Found {main_metadata.num_rows} records in main Parquet file ({main_metadata.num_row_groups} row groups)")
+            logger.info(f"📋 Columns available: {len(main_columns)} columns")
             
             # Scan headers and populate lookup tables dynamically
-            lookup_mappings = self.scan_and_populate_lookup_tables(df_main)
+            lookup_mappings = self.scan_and_populate_lookup_tables(main_columns)
             
             # Load dual registration Parquet file and create lookup
             logger.info("🔗 Step 2: Loading dual registration data from Parquet file...")
             dual_file_size = Path(dual_parquet_path).stat().st_size / 1024
             logger.info(f"📁 Dual registration Parquet file size: {dual_file_size:.1f} KB")
             
-            df_dual = pd.read_parquet(dual_parquet_path)
+            df_dual = dual_future.result()
             logger.info(f"📋 Dual registration records: {len(df_dual)} rows")
             
             # Create efficient dual registration lookup dictionary
@@ -993,6 +1103,7 @@ class CQCDataImporter:
             dual_lookup = {}
             if not df_dual.empty:
                 # Create lookup by Location ID for fast access
+                log_progress = logger.isEnabledFor(logging.INFO)
                 for index, dual_row in df_dual.iterrows():
                     location_id = self.clean_value(dual_row.get('Location ID'))
                     if location_id:
@@ -1003,117 +1114,62 @@ class CQCDataImporter:
                             'primary_id': self.clean_value(dual_row.get('Primary ID'))
                         }
                         
-                    if (index + 1) % 50 == 0 or index + 1 == len(df_dual):
+                    if log_progress and ((index + 1) % 50 == 0 or index + 1 == len(df_dual)):
                         logger.info(f"   🔄 Processed {index + 1}/{len(df_dual)} dual registration records")
             
             logger.info(f"✅ Dual registration lookup created: {len(dual_lookup)} location mappings")
             
             # Filter for care homes if requested
             logger.info("🔽 Step 4: Applying data filters...")
-            if filter_care_homes is not None:
-                original_count = len(df_main)
+            # The filter is pushed into the Parquet scan: row groups whose statistics
+            # rule out a match are skipped and filtered rows are never converted
+            original_count = main_metadata.num_rows
+            main_dataset = ds.dataset(main_parquet_path, format=PARQUET_FORMAT)
+            row_filter = self.care_home_filter(filter_care_homes)
+            if row_filter is not None:
+                total_records = main_dataset.count_rows(filter=row_filter)
                 if filter_care_homes:
-                    df_main = df_main[df_main['Care home?'] == 'Y']
-                    logger.info(f"✅ Care homes filter applied: {len(df_main)} records (from {original_count})")
+                    logger.info(f"✅ Care homes filter applied: {total_records} records (from {original_count})")
                 else:
-                    df_main = df_main[df_main['Care home?'] != 'Y']
-                    logger.info(f"✅ Non-care homes filter applied: {len(df_main)} records (from {original_count})")
+                    logger.info(f"✅ Non-care homes filter applied: {total_records} records (from {original_count})")
             else:
-                logger.info(f"✅ No filter applied: processing all {len(df_main)} records")
+                total_records = original_count
+                logger.info(f"✅ No filter applied: processing all {total_records} records")
             
             # Process main data
             logger.info("🔄 Step 5: Processing main data records...")
             processed_count = 0
-            providers_created = 0
-            locations_created = 0
+            current_record = 0
             
-            for index, row in df_main.iterrows():
+            # Project to the mapped columns: unused column chunks are never read or decoded
+            dynamic_columns = [column for mapping in lookup_mappings.values() for column in mapping]
+            main_projection = [column for column in MAIN_COLUMNS if column in main_columns] + dynamic_columns
+            logger.info(f"📐 Reading {len(main_projection)} of {len(main_columns)} columns")
+            
+            for batch in main_dataset.to_batches(columns=main_projection, filter=row_filter, batch_size=PARQUET_BATCH_SIZE):
+                df_batch = batch.to_pandas()
+                batch_start = current_record
+                current_record += len(df_batch)
+                
                 try:
-                    current_record = index + 1
-                    
-                    # Progress logging every 100 records and at specific milestones
-                    if current_record % 100 == 0 or current_record in [1, 10, 50] or current_record == len(df_main):
-                        progress_pct = (current_record / len(df_main)) * 100
-                        logger.info(f"   📝 Processing record {current_record}/{len(df_main)} ({progress_pct:.1f}%)")
-                    
-                    # Create provider first
-                    provider_id = self.parse_primary_key(row.get('Provider ID'), 'Provider ID')
-                    if current_record <= 10:  # Log details for first 10 records
-                        logger.info(f"      🏢 Processing provider: {provider_id}")
-                    
-                    provider = self.get_or_create_provider_by_original_id(row)
-                    if not provider:
-                        if current_record <= 10:
-                            logger.warning(f"      ⚠️  Skipped record {current_record}: no provider created")
-                        continue
-                    
-                    # Create provider-brand relationship for this period
-                    brand_id = self.parse_primary_key(row.get('Brand ID'), 'Brand ID')
-                    brand_name = self.parse_string_field(row.get('Brand Name'), preserve_special=False)
-                    brand = None
-                    if brand_id and brand_id != '-':
-                        brand = self.get_or_create_brand(brand_id, brand_name)
-                    self.create_provider_brand_relationship(provider, brand, data_period)
-                    
-                    # Track if this is a new provider
-                    if provider_id not in getattr(self, '_seen_providers', set()):
-                        providers_created += 1
-                        if not hasattr(self, '_seen_providers'):
-                            self._seen_providers = set()
-                        self._seen_providers.add(provider_id)
-                    
-                    # Get or create location (static data)
-                    location_id = self.parse_primary_key(row.get('Location ID'), 'Location ID')
-                    location_name = self.parse_string_field(row.get('Location Name'), preserve_special=False)
-                    
-                    if current_record <= 10:
-                        logger.info(f"      🏠 Processing location: {location_id} - {location_name}")
-                    
-                    location = self.get_or_create_location_by_original_id(row, provider)
-                    if not location:
-                        if current_record <= 10:
-                            logger.warning(f"      ⚠️  Skipped record {current_record}: no location created")
-                        continue
-                    
-                    # Track if this is a new location
-                    if location_id not in getattr(self, '_seen_locations', set()):
-                        locations_created += 1
-                        if not hasattr(self, '_seen_locations'):
-                            self._seen_locations = set()
-                        self._seen_locations.add(location_id)
-                    
-                    # Create time-varying period data
-                    period_data = self.create_location_period_data(location, row, data_period)
-                    if not period_data:
-                        if current_record <= 10:
-                            logger.warning(f"      ⚠️  Skipped record {current_record}: no period data created")
-                        continue
-                    
-                    # Note: LocationActivityFlags table no longer used - data now in association tables
-                    
-                    # Create dynamic associations based on discovered columns
-                    self.create_dynamic_associations(location, row, data_period, lookup_mappings)
-                    
-                    # Note: Dual registration processing moved to separate step after main data processing
-                    
-                    # Commit the record
-                    self.db.commit()
-                    processed_count += 1
-                    
-                    # Progress updates at key intervals
-                    if processed_count % 500 == 0:
-                        elapsed = time.time() - start_time
-                        rate = processed_count / elapsed
-                        eta = (len(df_main) - processed_count) / rate if rate > 0 else 0
-                        logger.info(f"   ⏱️  Progress: {processed_count}/{len(df_main)} records ({rate:.1f} rec/sec, ETA: {eta/60:.1f}min)")
-                        
+                    processed_count += self._bulk_import_batch(df_batch, data_period, lookup_mappings)
                 except Exception as e:
+                    # Fall back to row-by-row so one bad row does not sink the whole batch
                     self.db.rollback()
-                    error_msg = f"❌ Row {current_record}: {str(e)}"
-                    self.stats["errors"].append(error_msg)
-                    logger.error(error_msg)
-                    continue
-            
+                    logger.warning(f"⚠️  Bulk insert failed for records {batch_start + 1}-{current_record}, retrying row by row: {str(e)}")
+                    processed_count += self._import_rows(df_batch, data_period, lookup_mappings, batch_start, total_records)
+                
+                elapsed = time.time() - start_time
+                rate = current_record / elapsed if elapsed > 0 else 0
+                eta = (total_records - current_record) / rate if rate > 0 else 0
+                progress_pct = (current_record / total_records) * 100 if total_records else 100
+                logger.info(f"   ⏱️  Progress: {current_record}/{total_records} records ({progress_pct:.1f}%, {rate:.1f} rec/sec, ETA: {eta/60:.1f}min)")
+                if progress_callback:
+                    progress_callback(current_record, total_records, self.stats)
+            
+            providers_created = len(self._seen_providers)
+            locations_created = len(self._seen_locations)
+                
             # Process dual registrations separately after main data
             logger.info("🔗 Step 6: Processing dual registrations...")
             dual_registrations_created = 0
@@ -1121,71 +1177,11 @@ class CQCDataImporter:
             if not df_dual.empty:
                 logger.info(f"📋 Processing {len(dual_lookup)} dual registration mappings...")
                 
-                for location_id, dual_info in dual_lookup.items():
-                    try:
-                        linked_organisation_id = dual_info['linked_organisation_id']
-                        relationship_type = dual_info['relationship_type']
-                        
-                        if linked_organisation_id and linked_organisation_id != location_id:
-                            # Verify both locations exist
-                            location = self.db.query(Location).filter(Location.location_id == location_id).first()
-                            linked_location = self.db.query(Location).filter(Location.location_id == linked_organisation_id).first()
-                            
-                            if location and linked_location:
-                                # Create dual registration records (bidirectional)
-                                primary_id_value = dual_info['primary_id']
-                                is_location_primary = self.parse_boolean(primary_id_value)
-                                is_linked_primary = not is_location_primary
-                                
-                                # Create dual registration record for current location
-                                existing_dual = self.db.query(DualRegistration).filter(
-                                    DualRegistration.location_id == location.location_id,
-                                    DualRegistration.linked_organisation_id == linked_location.location_id,
-                                    DualRegistration.period_id == data_period.period_id
-                                ).first()
-                                
-                                if not existing_dual:
-                                    dual_reg = DualRegistration(
-                                        location_id=location.location_id,
-                                        linked_organisation_id=linked_location.location_id,
-                                        period_id=data_period.period_id,
-                                        relationship_type=relationship_type,
-                                        relationship_start_date=dual_info['relationship_start_date'],
-                                        is_primary=is_location_primary
-                                    )
-                                    self.db.add(dual_reg)
-                                    dual_registrations_created += 1
-                                
-                                # Create reverse dual registration record
-                                existing_dual_reverse = self.db.query(DualRegistration).filter(
-                                    DualRegistration.location_id == linked_location.location_id,
-                                    DualRegistration.linked_organisation_id == location.location_id,
-                                    DualRegistration.period_id == data_period.period_id
-                                ).first()
-                                
-                                if not existing_dual_reverse:
-                                    dual_reg_reverse = DualRegistration(
-                                        location_id=linked_location.location_id,
-                                        linked_organisation_id=location.location_id,
-                                        period_id=data_period.period_id,
-                                        relationship_type=relationship_type,
-                                        relationship_start_date=dual_info['relationship_start_date'],
-                                        is_primary=is_linked_primary
-                                    )
-                                    self.db.add(dual_reg_reverse)
-                                
-                                # Commit dual registration records
-                                self.db.commit()
-                                
-                                logger.info(f"✅ Created dual registration: {location.location_name} ↔ {linked_location.location_name}")
-                            else:
-                                if not location:
-                                    logger.warning(f"⚠️  Location not found with original ID: {location_id}")
-                                if not linked_location:
-                                    logger.warning(f"⚠️  Linked location not found with original ID: {linked_organisation_id}")
-                    except Exception as e:
-                        logger.warning(f"❌ Failed to process dual registration for {location_id}: {str(e)}")
-                        continue
+                try:
+                    dual_registrations_created = self._bulk_import_dual_registrations(dual_lookup, data_period)
+                except Exception as e:
+                    self.db.rollback()
+                    logger.warning(f"❌ Failed to process dual registrations: {str(e)}")
                 
                 logger.info(f"✅ Dual registration processing complete: {dual_registrations_created} pairs created")
             else:
@@ -1205,17 +1201,18 @@ class CQCDataImporter:
             
             # Final summary
             logger.info("🎉 PARQUET IMPORT SUMMARY:")
-            logger.info(f"   📊 Records processed: {processed_count}/{len(df_main)}")
+            logger.info(f"   📊 Records processed: {processed_count}/{total_records}")
             logger.info(f"   🏢 Providers processed: {providers_created}")
             logger.info(f"   🏠 Locations processed: {locations_created}")
             logger.info(f"   🔗 Dual registrations created: {dual_registrations_created}")
             logger.info(f"   ⏱️  Total import time: {total_time:.2f} seconds")
             logger.info(f"   🚀 Processing speed: {records_per_second:.1f} records/second")
-            logger.info(f"   📈 Performance: {len(df_main) / (total_time/60):.0f} records/minute")
+            logger.info(f"   📈 Performance: {total_records / (total_time/60):.0f} records/minute")
             
             if self.stats["errors"]:
                 logger.warning(f"   ⚠️  Errors encountered: {len(self.stats['errors'])}")
             
+            self._analyze_loaded_tables()
             logger.info("✅ Optimized Parquet import completed successfully!")
             
             return self.stats
@@ -1224,10 +1221,315 @@ class CQCDataImporter:
             logger.error(f"Parquet import failed: {str(e)}")
             self.stats["errors"].append(f"Parquet import failed: {str(e)}")
             return self.stats
+        finally:
+            self._disable_bulk_load()
+            self._touch_data_period(year, month)
+
+    def _enable_bulk_load(self):
+        """Apply BULK_LOAD_SETTINGS to the current and every later transaction of this session"""
+        if not event.contains(self.db, "after_begin", _apply_bulk_load_settings):
+            event.listen(self.db, "after_begin", _apply_bulk_load_settings)
+        if self.db.in_transaction():
+            _apply_bulk_load_settings(self.db, None, self.db.connection())
+
+    def _disable_bulk_load(self):
+        """Stop applying bulk-load settings; values already set expire with their transaction"""
+        if event.contains(self.db, "after_begin", _apply_bulk_load_settings):
+            event.remove(self.db, "after_begin", _apply_bulk_load_settings)
+
+    def _analyze_loaded_tables(self):
+        """Refresh planner statistics after a bulk load (needs table ownership; best effort)"""
+        try:
+            for table_name in BULK_LOADED_TABLES:
+                self.db.execute(text(f"ANALYZE {table_name}"))
+            self.db.commit()
+            logger.info(f"📈 Refreshed planner statistics for {len(BULK_LOADED_TABLES)} tables")
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(f"⚠️  ANALYZE after import skipped: {str(e)}")
+
+    @staticmethod
+    def _read_dual_parquet(dual_parquet_path: str) -> pd.DataFrame:
+        """Read only the DUAL_COLUMNS present in the dual registration Parquet file"""
+        available = set(pq.read_schema(dual_parquet_path).names)
+        columns = [column for column in DUAL_COLUMNS if column in available]
+        return pq.read_table(dual_parquet_path, columns=columns, pre_buffer=True).to_pandas()
+
+    def _insert_ignoring_conflicts(self, model, rows: List[Dict]) -> int:
+        """
+        Multi-row INSERT ... ON CONFLICT DO NOTHING for one model.
+
+        Rows that already exist are skipped, so re-importing a period is idempotent.
+        Returns the number of rows actually inserted.
+        """
+        if not rows:
+            return 0
+        table = model.__table__
+        # The ORM substitutes scalar column defaults for None; keep that behaviour
+        defaults = {
+            column.name: column.default.arg
+            for column in table.columns
+            if column.default is not None and column.default.is_scalar
+        }
+        if defaults:
+            rows = [
+                {**row, **{name: value for name, value in defaults.items() if row.get(name) is None}}
+                for row in rows
+            ]
+        if len(rows) >= COPY_MIN_ROWS:
+            return self._copy_ignoring_conflicts(table, rows)
+        stmt = pg_insert(table).on_conflict_do_nothing().returning(*table.primary_key.columns)
+        return len(self.db.execute(stmt, rows).all())
+
+    def _copy_ignoring_conflicts(self, table, rows: List[Dict]) -> int:
+        """
+        Load rows with COPY FROM STDIN, then merge them into table skipping conflicts.
+
+        COPY cannot skip existing keys itself, so rows go to a transaction-scoped
+        staging table first (plain column copies: no defaults, so no sequence values
+        are consumed) and are merged with one INSERT ... SELECT ... ON CONFLICT DO NOTHING.
+        Returns the number of rows actually inserted.
+        """
+        present = set().union(*rows)
+        columns = [column.name for column in table.columns if column.name in present]
+        column_list = ", ".join(f'"{name}"' for name in columns)
+        staging = f"_copy_{table.name}"
+        
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join(
+                COPY_NULL if row.get(name) is None else str(row[name]).translate(_COPY_ESCAPES)
+                for name in columns
+            ))
+            buffer.write("\n")
+        buffer.seek(0)
+        
+        self.db.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {staging} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM {table.name} WITH NO DATA"
+        ))
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {staging} ({column_list}) FROM STDIN", buffer)
+        finally:
+            cursor.close()
+        result = self.db.execute(text(
+            f"INSERT INTO {table.name} ({column_list}) SELECT {column_list} FROM {staging} ON CONFLICT DO NOTHING"
+        ))
+        self.db.execute(text(f"TRUNCATE {staging}"))
+        return result.rowcount
+
+    def _bulk_import_batch(self, df_batch: pd.DataFrame, data_period: DataPeriod, lookup_mappings: Dict[str, Dict[str, int]]) -> int:
+        """
+        Import one record batch with set-based inserts and a single commit.
+
+        Rows are parsed with the same helpers as the row-by-row path. Within a
+        batch the first occurrence of a key wins and existing database rows are
+        left untouched, matching the get_or_create semantics.
+        """
+        period_id = data_period.period_id
+        brands, providers, locations, period_data = {}, {}, {}, {}
+        provider_brands = set()
+        activities, service_types, user_bands = set(), set(), set()
+        batch_providers, batch_locations = set(), set()
+        processed = 0
+        
+        for row in df_batch.to_dict('records'):
+            provider_id = self.parse_primary_key(row.get('Provider ID'), 'Provider ID')
+            if not provider_id:
+                continue
+            if provider_id not in providers:
+                providers[provider_id] = self._provider_values(row, provider_id)
+            batch_providers.add(provider_id)
+            
+            brand_id = self.parse_primary_key(row.get('Brand ID'), 'Brand ID')
+            if brand_id and brand_id != '-':
+                if brand_id not in brands:
+                    brand_name = self.parse_string_field(row.get('Brand Name'), preserve_special=False)
+                    brands[brand_id] = {
+                        "brand_id": brand_id,
+                        "brand_name": self.parse_string_field(brand_name, preserve_special=False) or f"Brand {brand_id}"
+                    }
+                provider_brands.add((provider_id, brand_id))
+            
+            location_id = self.parse_primary_key(row.get('Location ID'), 'Location ID')
+            if not location_id:
+                continue
+            if location_id not in locations:
+                locations[location_id] = self._location_values(row, location_id, provider_id)
+                period_data[location_id] = self._location_period_values(row, location_id, period_id)
+            batch_locations.add(location_id)
+            
+            for column, activity_id in lookup_mappings['regulated_activities'].items():
+                if self.parse_boolean_field(row.get(column)):
+                    activities.add((location_id, activity_id))
+            for column, service_type_id in lookup_mappings['service_types'].items():
+                if self.parse_boolean_field(row.get(column)):
+                    service_types.add((location_id, service_type_id))
+            for column, band_id in lookup_mappings['service_user_bands'].items():
+                if self.parse_boolean_field(row.get(column)):
+                    user_bands.add((location_id, band_id))
+            processed += 1
+        
+        # Parents before children so foreign keys resolve within the transaction
+        self.stats["brands_created"] += self._insert_ignoring_conflicts(Brand, list(brands.values()))
+        self.stats["providers_created"] += self._insert_ignoring_conflicts(Provider, list(providers.values()))
+        self._insert_ignoring_conflicts(ProviderBrand, [
+            {"provider_id": p, "brand_id": b, "period_id": period_id} for p, b in provider_brands
+        ])
+        self.stats["locations_created"] += self._insert_ignoring_conflicts(Location, list(locations.values()))
+        self.stats["location_period_data_created"] += self._insert_ignoring_conflicts(LocationPeriodData, list(period_data.values()))
+        self.stats["activities_created"] += self._insert_ignoring_conflicts(LocationRegulatedActivity, [
+            {"location_id": loc, "activity_id": a, "period_id": period_id} for loc, a in activities
+        ])
+        self.stats["service_types_created"] += self._insert_ignoring_conflicts(LocationServiceType, [
+            {"location_id": loc, "service_type_id": st, "period_id": period_id} for loc, st in service_types
+        ])
+        self.stats["user_bands_created"] += self._insert_ignoring_conflicts(LocationServiceUserBand, [
+            {"location_id": loc, "band_id": b, "period_id": period_id} for loc, b in user_bands
+        ])
+        self.db.commit()
+        
+        self._seen_providers.update(batch_providers)
+        self._seen_locations.update(batch_locations)
+        return processed
+
+    def _import_rows(self, df_batch: pd.DataFrame, data_period: DataPeriod, lookup_mappings: Dict[str, Dict[str, int]], offset: int, total_records: int) -> int:
+        """Row-by-row import of one record batch; isolates rows that fail the bulk path"""
+        processed = 0
+        current_record = offset
+        # Progress and per-record details are only formatted when INFO is enabled
+        log_progress = logger.isEnabledFor(logging.INFO)
+        
+        for _, row in df_batch.iterrows():
+            try:
+                current_record += 1
+                
+                # Progress logging every 100 records and at specific milestones
+                if log_progress and (current_record % 100 == 0 or current_record in [1, 10, 50] or current_record == total_records):
+                    progress_pct = (current_record / total_records) * 100
+                    logger.info(f"   📝 Processing record {current_record}/{total_records} ({progress_pct:.1f}%)")
+                
+                # Create provider first
+                provider_id = self.parse_primary_key(row.get('Provider ID'), 'Provider ID')
+                if log_progress and current_record <= 10:  # Log details for first 10 records
+                    logger.info(f"      🏢 Processing provider: {provider_id}")
+                
+                provider = self.get_or_create_provider_by_original_id(row)
+                if not provider:
+                    if current_record <= 10:
+                        logger.warning(f"      ⚠️  Skipped record {current_record}: no provider created")
+                    continue
+                
+                # Create provider-brand relationship for this period
+                brand_id = self.parse_primary_key(row.get('Brand ID'), 'Brand ID')
+                brand_name = self.parse_string_field(row.get('Brand Name'), preserve_special=False)
+                brand = None
+                if brand_id and brand_id != '-':
+                    brand = self.get_or_create_brand(brand_id, brand_name)
+                self.create_provider_brand_relationship(provider, brand, data_period)
+                self._seen_providers.add(provider_id)
+                
+                # Get or create location (static data)
+                location_id = self.parse_primary_key(row.get('Location ID'), 'Location ID')
+                location_name = self.parse_string_field(row.get('Location Name'), preserve_special=False)
+                
+                if log_progress and current_record <= 10:
+                    logger.info(f"      🏠 Processing location: {location_id} - {location_name}")
+                
+                location = self.get_or_create_location_by_original_id(row, provider)
+                if not location:
+                    if current_record <= 10:
+                        logger.warning(f"      ⚠️  Skipped record {current_record}: no location created")
+                    continue
+                self._seen_locations.add(location_id)
+                
+                # Create time-varying period data
+                period_data = self.create_location_period_data(location, row, data_period)
+                if not period_data:
+                    if current_record <= 10:
+                        logger.warning(f"      ⚠️  Skipped record {current_record}: no period data created")
+                    continue
+                
+                # Create dynamic associations based on discovered columns
+                self.create_dynamic_associations(location, row, data_period, lookup_mappings)
+                
+                # Commit the record
+                self.db.commit()
+                processed += 1
+                    
+            except Exception as e:
+                self.db.rollback()
+                error_msg = f"❌ Row {current_record}: {str(e)}"
+                self.stats["errors"].append(error_msg)
+                logger.error(error_msg)
+                continue
+        
+        return processed
+
+    def _bulk_import_dual_registrations(self, dual_lookup: Dict[str, Dict], data_period: DataPeriod) -> int:
+        """
+        Insert bidirectional dual registration records in one statement.
+
+        Both locations must already exist. Returns the number of forward
+        (location -> linked organisation) records created.
+        """
+        period_id = data_period.period_id
+        pairs = [
+            (location_id, dual_info) for location_id, dual_info in dual_lookup.items()
+            if dual_info['linked_organisation_id'] and dual_info['linked_organisation_id'] != location_id
+        ]
+        referenced_ids = {location_id for location_id, _ in pairs} | {info['linked_organisation_id'] for _, info in pairs}
+        existing_ids = set()
+        referenced_list = list(referenced_ids)
+        for start in range(0, len(referenced_list), 1000):
+            chunk = referenced_list[start:start + 1000]
+            existing_ids.update(self.db.execute(
+                select(Location.location_id).where(Location.location_id.in_(chunk))
+            ).scalars())
+        
+        # Keyed on (location, linked organisation); the first record for a key wins
+        records: Dict[Tuple[str, str], Dict] = {}
+        forward_keys = set()
+        for location_id, dual_info in pairs:
+            linked_organisation_id = dual_info['linked_organisation_id']
+            if location_id not in existing_ids or linked_organisation_id not in existing_ids:
+                if location_id not in existing_ids:
+                    logger.warning(f"⚠️  Location not found with original ID: {location_id}")
+                if linked_organisation_id not in existing_ids:
+                    logger.warning(f"⚠️  Linked location not found with original ID: {linked_organisation_id}")
+                continue
+            
+            is_location_primary = self.parse_boolean(dual_info['primary_id'])
+            for source_id, target_id, is_primary in (
+                (location_id, linked_organisation_id, is_location_primary),
+                (linked_organisation_id, location_id, not is_location_primary),
+            ):
+                key = (source_id, target_id)
+                if key in records:
+                    continue
+                records[key] = {
+                    "location_id": source_id,
+                    "linked_organisation_id": target_id,
+                    "period_id": period_id,
+                    "relationship_type": dual_info['relationship_type'],
+                    "relationship_start_date": dual_info['relationship_start_date'],
+                    "is_primary": is_primary
+                }
+                if source_id == location_id:
+                    forward_keys.add(key)
+        
+        if not records:
+            return 0
+        table = DualRegistration.__table__
+        stmt = pg_insert(table).on_conflict_do_nothing().returning(table.c.location_id, table.c.linked_organisation_id)
+        inserted = self.db.execute(stmt, list(records.values())).all()
+        self.db.commit()
+        return sum(1 for row in inserted if tuple(row) in forward_keys)
 
-    def scan_and_populate_lookup_tables(self, df: pd.DataFrame) -> Dict[str, Dict[str, int]]:
+    def scan_and_populate_lookup_tables(self, columns: Iterable[str]) -> Dict[str, Dict[str, int]]:
         """
-        Scan CSV/Excel headers and populate lookup tables dynamically
+        Scan CSV/Excel/Parquet headers and populate lookup tables dynamically
         Returns mapping of column names to database IDs for each category
         """
         logger.info("🔍 Scanning headers and populating lookup tables...")
@@ -1238,7 +1540,7 @@ class CQCDataImporter:
             'service_user_bands': {}
         }
         
-        for column in df.columns:
+        for column in columns:
             # Check for regulated activity columns
             if column.startswith('Regulated activity - '):
                 full_name = column  # Store the complete column name
@@ -0,0 +1,79 @@
+"""
+HTTP conditional-request helpers (ETag / Cache-Control) for read-only endpoints
+"""
+import hashlib
+from decimal import Decimal
+from typing import Any, Optional
+
+import orjson
+from fastapi import Request, Response
+from fastapi.encoders import decimal_encoder
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.data_period import DataPeriod
+
+CACHE_CONTROL = "private, max-age=30"
+# For fast-changing resources: clients may keep a copy but must revalidate (cheap 304) each time
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+_DATA_VERSION_STMT = select(
+    func.max(DataPeriod.created_at), func.max(DataPeriod.updated_at), func.count(DataPeriod.period_id)
+)
+
+
+def _orjson_default(value: Any) -> Any:
+    """Encode Decimals (NUMERIC columns) as numbers, the way jsonable_encoder does"""
+    if isinstance(value, Decimal):
+        return decimal_encoder(value)
+    raise TypeError
+
+
+class CacheableJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serialises Decimal values as JSON numbers"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong, quoted ETag from the given version parts"""
+    digest = hashlib.md5("-".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+async def async_data_version(db: AsyncSession) -> str:
+    """
+    Cheap version token for imported data.
+
+    Data only changes on import, and every import creates a DataPeriod row or
+    bumps its updated_at when it finishes, so MAX(created_at) + MAX(updated_at)
+    + COUNT(*) is enough to detect change.
+    """
+    max_created, max_updated, period_count = (await db.execute(_DATA_VERSION_STMT)).one()
+    return f"{max_created}-{max_updated}-{period_count}"
+
+
+def not_modified(request: Request, etag: str, cache_control: str = CACHE_CONTROL) -> Optional[Response]:
+    """Return a 304 response if the client's If-None-Match matches the ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    if etag in candidates or f"W/{etag}" in candidates or "*" in candidates:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+    return None
+
+
+def cacheable_response(payload: Any, etag: str, cache_control: str = CACHE_CONTROL) -> ORJSONResponse:
+    """
+    Wrap a JSON payload with ETag and Cache-Control headers.
+
+    Serialised with orjson (bytes directly, several times faster than stdlib json
+    on large lists); payloads must stick to JSON-native types, Decimals, dates and datetimes.
+    """
+    return CacheableJSONResponse(payload, headers={"ETag": etag, "Cache-Control": cache_control})
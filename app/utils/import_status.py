@@ -67,6 +67,20 @@ class ImportStatusTracker:
         
         self._save_status(status)
     
+    def update_details(self, **details):
+        """Merge extra progress fields (e.g. per-file counters) into the current status"""
+        if not self.current_import:
+            return
+        
+        status = self._load_status()
+        if not status:
+            return
+        
+        status.update(details)
+        status["last_updated"] = datetime.now().isoformat()
+        
+        self._save_status(status)
+    
     def complete_phase(self, phase: str):
         """Mark a phase as completed"""
         if not self.current_import:
@@ -0,0 +1,53 @@
+"""
+Logging handlers that batch file writes instead of flushing every record
+"""
+import logging
+from logging.handlers import QueueListener
+
+LOG_BUFFER_BYTES = 64 * 1024
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that writes through a large buffer instead of flushing every record.
+
+    Records reach the file when the buffer fills, on ERROR and above, on close,
+    and whenever flush_buffer() is called.
+    """
+
+    def __init__(self, filename, mode='a', encoding=None, buffer_size: int = LOG_BUFFER_BYTES):
+        self.buffer_size = buffer_size
+        super().__init__(filename, mode, encoding)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            self.flush_buffer()
+
+    def flush(self) -> None:
+        """Per-record flushes are skipped; see flush_buffer()"""
+
+    def flush_buffer(self) -> None:
+        """Write everything buffered so far to the file"""
+        super().flush()
+
+
+class DrainingQueueListener(QueueListener):
+    """QueueListener that flushes buffered handlers each time its queue runs dry"""
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if block and self.queue.empty():
+            self._flush_handlers()
+        return super().dequeue(block)
+
+    def stop(self) -> None:
+        super().stop()
+        self._flush_handlers()
+
+    def _flush_handlers(self) -> None:
+        for handler in self.handlers:
+            getattr(handler, "flush_buffer", handler.flush)()
@@ -1,18 +1,64 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import logging
+import multiprocessing
+import os
 import time
 import threading
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Default pyarrow writer settings: ZSTD is smaller than Snappy at similar read speed,
+# 64K-row groups keep column chunks small, and statistics enable row-group pruning
+PARQUET_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "row_group_size": 65536,
+    "use_dictionary": True,
+    "write_statistics": True,
+}
+
+# Main-sheet column the import filters on; rows are clustered by it when written
+CARE_HOME_COLUMN = "Care home?"
+
+# Footer key marking a dual file written as an empty stand-in because the sheet could
+# not be read; such a pair serves the import at hand but is never reused
+PARTIAL_DUAL_KEY = b"cqc_partial_dual"
+
+# Parsing ODS/XLSX is pure-Python work that holds the GIL for minutes; conversions
+# run in separate worker processes so API threads and the import worker keep going
+CONVERSION_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+_conversion_pool: Dict[str, Optional[ProcessPoolExecutor]] = {"pool": None}
+_conversion_pool_lock = threading.Lock()
+# Workers log onto this queue; a listener thread here replays their records through
+# this process's loggers, so they reach the same handlers (console, cqc_api.log)
+_worker_log: Dict[str, Any] = {"queue": None, "listener": None}
+
+
+@lru_cache(maxsize=32)
+def _cached_parquet_metadata(path: str, mtime_ns: int, size: int) -> pq.FileMetaData:
+    return pq.read_metadata(path)
+
+
+def read_parquet_metadata(path: str) -> pq.FileMetaData:
+    """Parquet footer for path, parsed once per file version (keyed on path, mtime and size)"""
+    file_stat = os.stat(path)
+    return _cached_parquet_metadata(str(path), file_stat.st_mtime_ns, file_stat.st_size)
+
 
 class ParquetConverter:
     """Utility class for converting ODS files to Parquet format for faster processing"""
     
-    def __init__(self):
+    def __init__(self, parquet_write_options: Optional[Dict] = None):
+        self.write_options = {**PARQUET_WRITE_OPTIONS, **(parquet_write_options or {})}
         self.stats = {
             "main_data_rows": 0,
             "dual_registration_rows": 0,
@@ -33,6 +79,7 @@ class ParquetConverter:
         """
         import time
         start_time = time.time()
+        tmp_paths: Tuple[Path, ...] = ()
         
         try:
             file_path_obj = Path(file_path)
@@ -57,10 +104,12 @@ class ParquetConverter:
                 output_dir = Path(output_dir)
                 output_dir.mkdir(exist_ok=True)
             
-            # Generate output file names based on input file
-            base_name = file_path_obj.stem
-            main_parquet_path = output_dir / f"{base_name}_main.parquet"
-            dual_parquet_path = output_dir / f"{base_name}_dual.parquet"
+            # Generate output file names based on input file; both are written under
+            # temporary names and renamed into place together once the pair is complete
+            main_parquet_path, dual_parquet_path = self.parquet_paths(file_path, output_dir)
+            tmp_paths = self._tmp_path(main_parquet_path), self._tmp_path(dual_parquet_path)
+            main_tmp_path, dual_tmp_path = tmp_paths
+            dual_partial = False
             
             # Check file size and warn about potential performance issues
             file_size_mb = file_path_obj.stat().st_size / (1024 * 1024)
@@ -133,12 +182,17 @@ class ParquetConverter:
                     self.stats["errors"].append(error_msg)
                     raise Exception(error_msg)
                 
+                if CARE_HOME_COLUMN in df_main.columns:
+                    # Cluster care homes together so row-group min/max statistics let the
+                    # filtered import skip whole row groups (stable: file order kept within groups)
+                    df_main = df_main.sort_values(CARE_HOME_COLUMN, kind="stable", na_position="last", ignore_index=True)
+                
                 logger.info(f"💾 Writing main data to Parquet: {main_parquet_path}")
-                df_main.to_parquet(main_parquet_path, compression='snappy')
+                self._write_parquet(df_main, main_tmp_path)
                 self.stats["main_data_rows"] = len(df_main)
                 
                 # Calculate file sizes for comparison
-                parquet_size = Path(main_parquet_path).stat().st_size / (1024 * 1024)
+                parquet_size = main_tmp_path.stat().st_size / (1024 * 1024)
                 logger.info(f"✅ Main data conversion complete: {len(df_main)} rows → {parquet_size:.1f} MB Parquet file")
             except Exception as e:
                 error_msg = f"❌ Failed to convert main data sheet: {str(e)}"
@@ -207,6 +261,7 @@ class ParquetConverter:
                         logger.warning(f"⏱️  Dual registration reading timeout ({dual_timeout_minutes}min) - creating empty file")
                         logger.warning("📝 Note: Main data import will proceed without dual registration data")
                         df_dual = pd.DataFrame()  # Create empty DataFrame
+                        dual_partial = True
                     
                     # Remove completely empty rows
                     df_dual = df_dual.dropna(how='all')
@@ -214,10 +269,10 @@ class ParquetConverter:
                     
                     if not df_dual.empty:
                         logger.info(f"💾 Writing dual registrations to Parquet: {dual_parquet_path}")
-                        df_dual.to_parquet(dual_parquet_path, compression='snappy')
+                        self._write_parquet(df_dual, dual_tmp_path)
                         self.stats["dual_registration_rows"] = len(df_dual)
                         
-                        dual_size = Path(dual_parquet_path).stat().st_size / 1024
+                        dual_size = dual_tmp_path.stat().st_size / 1024
                         logger.info(f"✅ Dual registration conversion complete: {len(df_dual)} rows → {dual_size:.1f} KB Parquet file")
                     else:
                         logger.info("⚠️  Dual registration sheet is empty, creating empty Parquet file")
@@ -228,7 +283,7 @@ class ParquetConverter:
                             'Linked Organisation ID', 'Linked Organisation Name',
                             'Relationship', 'Relationship Start Date', 'Primary ID'
                         ])
-                        empty_df.to_parquet(dual_parquet_path, compression='snappy')
+                        self._write_parquet(empty_df, dual_tmp_path, partial=dual_partial)
                         self.stats["dual_registration_rows"] = 0
                 else:
                     logger.warning("⚠️  No third sheet found for dual registrations, creating empty Parquet file")
@@ -240,7 +295,7 @@ class ParquetConverter:
                         'Relationship', 'Relationship Start Date', 'Primary ID'
                     ])
                     logger.info(f"💾 Creating empty dual registration Parquet: {dual_parquet_path}")
-                    empty_df.to_parquet(dual_parquet_path, compression='snappy')
+                    self._write_parquet(empty_df, dual_tmp_path)
                     self.stats["dual_registration_rows"] = 0
                     logger.info("✅ Empty dual registration Parquet file created")
                     
@@ -256,10 +311,14 @@ class ParquetConverter:
                     'Linked Organisation ID', 'Linked Organisation Name',
                     'Relationship', 'Relationship Start Date', 'Primary ID'
                 ])
-                empty_df.to_parquet(dual_parquet_path, compression='snappy')
+                self._write_parquet(empty_df, dual_tmp_path, partial=True)
                 self.stats["dual_registration_rows"] = 0
                 logger.info("✅ Fallback empty dual registration file created")
             
+            # Both files are written: publish them as a pair
+            os.replace(main_tmp_path, main_parquet_path)
+            os.replace(dual_tmp_path, dual_parquet_path)
+            
             # Calculate conversion time
             self.stats["conversion_time"] = time.time() - start_time
             
@@ -284,42 +343,106 @@ class ParquetConverter:
             error_msg = f"ODS to Parquet conversion failed: {str(e)}"
             self.stats["errors"].append(error_msg)
             logger.error(error_msg)
+            # Drop half-written output; existing Parquet files are left untouched
+            for tmp_path in tmp_paths:
+                tmp_path.unlink(missing_ok=True)
             raise
     
+    @staticmethod
+    def parquet_paths(file_path: str, output_dir: str = None) -> Tuple[Path, Path]:
+        """Return the (main, dual) Parquet paths a source file converts to"""
+        source = Path(file_path)
+        folder = Path(output_dir) if output_dir is not None else source.parent
+        return folder / f"{source.stem}_main.parquet", folder / f"{source.stem}_dual.parquet"
+    
+    def find_up_to_date_parquet(self, file_path: str, output_dir: str = None) -> Optional[Dict[str, str]]:
+        """
+        Return existing Parquet paths for a source file if both are at least as new as it.
+        
+        Returns None when either file is missing or older than the source, or when the
+        dual file is only a stand-in for an unreadable sheet, in which case the source
+        needs (re)converting.
+        """
+        main_parquet_path, dual_parquet_path = self.parquet_paths(file_path, output_dir)
+        try:
+            source_mtime = Path(file_path).stat().st_mtime_ns
+            parquet_mtime = min(main_parquet_path.stat().st_mtime_ns, dual_parquet_path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            return None
+        
+        if parquet_mtime < source_mtime:
+            return None
+        try:
+            dual_metadata = read_parquet_metadata(str(dual_parquet_path)).metadata or {}
+        except (OSError, pa.ArrowException):
+            return None
+        if PARTIAL_DUAL_KEY in dual_metadata:
+            return None
+        return {
+            "main_parquet": str(main_parquet_path),
+            "dual_parquet": str(dual_parquet_path)
+        }
+    
+    @staticmethod
+    def _tmp_path(path: Path) -> Path:
+        """Temporary name a Parquet file is written under before being renamed into place"""
+        return path.with_name(f".{path.name}.tmp")
+    
+    def _write_parquet(self, df: pd.DataFrame, path, partial: bool = False) -> None:
+        """Write a DataFrame to Parquet using the configured writer options, optionally marked partial"""
+        if not partial:
+            df.to_parquet(path, **self.write_options)
+            return
+        table = pa.Table.from_pandas(df)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), PARTIAL_DUAL_KEY: b"1"})
+        pq.write_table(table, path, **self.write_options)
+    
     def get_parquet_info(self, parquet_file_path: str) -> Dict:
-        """Get information about a Parquet file"""
+        """
+        Get information about a Parquet file.
+        
+        Answered from the (cached) footer; memory_usage is the uncompressed size
+        of all row groups rather than a measured DataFrame.
+        """
         try:
-            df = pd.read_parquet(parquet_file_path)
+            metadata = read_parquet_metadata(parquet_file_path)
+            column_names = metadata.schema.to_arrow_schema().names
             return {
-                "rows": len(df),
-                "columns": len(df.columns),
-                "column_names": list(df.columns),
+                "rows": metadata.num_rows,
+                "columns": len(column_names),
+                "column_names": column_names,
                 "file_size": Path(parquet_file_path).stat().st_size,
-                "memory_usage": df.memory_usage(deep=True).sum()
+                "memory_usage": sum(metadata.row_group(i).total_byte_size for i in range(metadata.num_row_groups))
             }
         except Exception as e:
             logger.error(f"Failed to get Parquet info: {str(e)}")
             return {"error": str(e)}
     
     def validate_parquet_files(self, main_parquet: str, dual_parquet: str) -> bool:
-        """Validate that Parquet files are readable and have expected structure"""
+        """
+        Validate that Parquet files are readable and have expected structure.
+        
+        Only the footers are read: the schema and row counts answer both checks,
+        so no row data is decoded before the (filtered) import scan.
+        """
         try:
             # Check main parquet file
-            df_main = pd.read_parquet(main_parquet)
+            main_columns = read_parquet_metadata(main_parquet).schema.to_arrow_schema().names
             required_main_columns = ['Location ID', 'Provider ID', 'Location Name']
             
-            missing_main_cols = [col for col in required_main_columns if col not in df_main.columns]
+            missing_main_cols = [col for col in required_main_columns if col not in main_columns]
             if missing_main_cols:
                 logger.error(f"Main Parquet file missing required columns: {missing_main_cols}")
                 return False
             
             # Check dual parquet file
-            df_dual = pd.read_parquet(dual_parquet)
+            dual_metadata = read_parquet_metadata(dual_parquet)
+            dual_columns = dual_metadata.schema.to_arrow_schema().names
             required_dual_columns = ['Location ID', 'Linked Organisation ID']
             
             # Only check if dual file has data
-            if not df_dual.empty:
-                missing_dual_cols = [col for col in required_dual_columns if col not in df_dual.columns]
+            if dual_metadata.num_rows > 0:
+                missing_dual_cols = [col for col in required_dual_columns if col not in dual_columns]
                 if missing_dual_cols:
                     logger.error(f"Dual Parquet file missing required columns: {missing_dual_cols}")
                     return False
@@ -329,4 +452,70 @@ class ParquetConverter:
             
         except Exception as e:
             logger.error(f"Parquet validation failed: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+class _ReplayHandler(logging.Handler):
+    """Hands records received from worker processes to the logger they were emitted on"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_conversion_worker(log_queue, log_level: str) -> None:
+    """Send a conversion process's logs at IMPORT_LOG_LEVEL back to the API process"""
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(log_level.upper())
+
+
+def _convert_file(file_path: str, output_dir: Optional[str]) -> Dict:
+    """Conversion entry point executed inside a worker process"""
+    return ParquetConverter().convert_ods_to_parquet(file_path, output_dir)
+
+
+def convert_in_worker_process(file_path: str, output_dir: str = None) -> Dict:
+    """
+    Run ParquetConverter.convert_ods_to_parquet in the conversion process pool and wait for it.
+    
+    Workers are spawned (not forked) so they never inherit the API's DB connections
+    or threads; the pool is created on first use and reused afterwards. If a worker
+    dies (e.g. OOM-killed) the broken pool is discarded and the conversion retried
+    once on a fresh one; later calls always get a working pool.
+    """
+    for attempt in range(2):
+        pool = _get_conversion_pool()
+        try:
+            return pool.submit(_convert_file, file_path, output_dir).result()
+        except BrokenProcessPool:
+            _discard_conversion_pool(pool)
+            if attempt:
+                raise RuntimeError(f"Conversion worker process died while converting {Path(file_path).name}")
+            logger.warning("Conversion worker process died; retrying on a fresh process pool")
+
+
+def _get_conversion_pool() -> ProcessPoolExecutor:
+    """The shared conversion pool, created on first use or after a broken one was discarded"""
+    with _conversion_pool_lock:
+        if _conversion_pool["pool"] is None:
+            mp_context = multiprocessing.get_context("spawn")
+            if _worker_log["queue"] is None:
+                _worker_log["queue"] = mp_context.Queue(-1)
+                _worker_log["listener"] = QueueListener(_worker_log["queue"], _ReplayHandler())
+                _worker_log["listener"].start()
+            _conversion_pool["pool"] = ProcessPoolExecutor(
+                max_workers=CONVERSION_WORKERS,
+                mp_context=mp_context,
+                initializer=_init_conversion_worker,
+                initargs=(_worker_log["queue"], settings.import_log_level)
+            )
+        return _conversion_pool["pool"]
+
+
+def _discard_conversion_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next call builds a new one (unless another thread already did)"""
+    with _conversion_pool_lock:
+        if _conversion_pool["pool"] is pool:
+            _conversion_pool["pool"] = None
+    pool.shutdown(wait=False)
@@ -0,0 +1,51 @@
+"""
+Short-lived cache for lookups that only change on import (period ids, reference names)
+"""
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.data_period import DataPeriod
+from app.models.regulated_activity import RegulatedActivity
+from app.models.service_type import ServiceType
+from app.models.service_user_band import ServiceUserBand
+from app.utils.ttl_cache import TTLCache
+
+# Periods and reference tables change at most once per monthly import; imports and
+# clears invalidate explicitly, the TTL only bounds staleness from out-of-process writers
+REFERENCE_TTL_SECONDS = 300
+_reference_cache = TTLCache(REFERENCE_TTL_SECONDS)
+
+_REFERENCE_QUERIES = {
+    "regulated_activities": select(RegulatedActivity.activity_id, RegulatedActivity.activity_name),
+    "service_types": select(ServiceType.service_type_id, ServiceType.service_type_name),
+    "service_user_bands": select(ServiceUserBand.band_id, ServiceUserBand.band_name),
+}
+
+
+def get_period_id(db: Session, year: Optional[int] = None, month: Optional[int] = None) -> Optional[int]:
+    """period_id for year/month, or the latest period when either is missing"""
+    def load() -> Optional[int]:
+        stmt = select(DataPeriod.period_id)
+        if year and month:
+            stmt = stmt.where(DataPeriod.year == year, DataPeriod.month == month)
+        else:
+            stmt = stmt.order_by(DataPeriod.year.desc(), DataPeriod.month.desc())
+        return db.execute(stmt.limit(1)).scalar()
+
+    key = ("period", year, month) if year and month else ("period", "latest")
+    return _reference_cache.get_or_set(key, load)
+
+
+def get_reference_names(db: Session) -> Dict[str, List[Tuple[int, str]]]:
+    """(id, name) pairs for regulated activities, service types and service user bands"""
+    return _reference_cache.get_or_set(
+        "reference_names",
+        lambda: {kind: [tuple(row) for row in db.execute(stmt)] for kind, stmt in _REFERENCE_QUERIES.items()}
+    )
+
+
+def invalidate_reference_cache() -> None:
+    """Forget cached periods and reference names, e.g. after an import or clear"""
+    _reference_cache.clear()
@@ -0,0 +1,34 @@
+"""
+Small in-process TTL cache for expensive, read-mostly results
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """Thread-safe key/value cache whose entries expire after a fixed number of seconds"""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing it with factory when missing or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+
+        # Computed outside the lock so a slow factory never blocks other keys
+        value = factory()
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. after the underlying data changed"""
+        with self._lock:
+            self._entries.clear()